@@ -0,0 +1,48 @@
+"""
+프로세스 내 TTL 캐시
+
+조회 응답처럼 짧은 시간 재사용해도 되는 값을 워커 프로세스 메모리에 보관합니다.
+(워커 간 공유되지 않으므로 다른 워커의 변경은 TTL 경과 후 반영됩니다)
+"""
+import time
+from typing import Any, Hashable, Optional
+
+
+class TTLCache:
+    """만료 시간이 있는 단순 dict 캐시 (단일 이벤트 루프 전용, 락 없음)"""
+    __slots__ = ("ttl", "maxsize", "_data")
+
+    def __init__(self, ttl: float, maxsize: int = 1024):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._data: dict[Hashable, tuple[float, Any]] = {}
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """캐시 값 조회 (없거나 만료되었으면 None)"""
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            self._data.pop(key, None)
+            return None
+        return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """캐시 값 저장 (가득 차면 만료 항목 → 가장 오래된 항목 순으로 제거)"""
+        now = time.monotonic()
+        if key not in self._data and len(self._data) >= self.maxsize:
+            expired = [k for k, (expires_at, _) in self._data.items() if expires_at < now]
+            for k in expired:
+                del self._data[k]
+            if len(self._data) >= self.maxsize:
+                del self._data[next(iter(self._data))]
+        self._data[key] = (now + self.ttl, value)
+
+    def delete(self, key: Hashable) -> None:
+        """캐시 항목 삭제"""
+        self._data.pop(key, None)
+
+    def clear(self) -> None:
+        """전체 캐시 무효화"""
+        self._data.clear()
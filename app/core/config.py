@@ -3,77 +3,125 @@
 환경 변수 및 기본 설정을 관리합니다.
 """
 import os
-from functools import lru_cache
-from pydantic_settings import BaseSettings
-from dotenv import load_dotenv
+from dataclasses import dataclass
+from functools import cached_property, lru_cache
+from pathlib import Path
+from sqlalchemy.engine import URL
 
-# .env 파일 로드
-load_dotenv()
+# 프로젝트 루트의 .env (로컬 개발용, 컨테이너 배포에서는 보통 없음)
+ENV_FILE = Path(__file__).resolve().parents[2] / ".env"
 
 
-class Settings(BaseSettings):
-    """애플리케이션 설정"""
-    
+def _env_bool(name: str, default: bool) -> bool:
+    """환경 변수를 bool로 변환 (1/true/yes/on → True)"""
+    value = os.getenv(name)
+    if value is None:
+        return default
+    return value.strip().lower() in ("1", "true", "yes", "on", "y")
+
+
+@dataclass(frozen=True)
+class Settings:
+    """
+    애플리케이션 설정
+
+    환경 변수는 from_env()에서 한 번만 읽습니다.
+    (cached_property 사용을 위해 slots는 사용하지 않습니다)
+    """
+
     # Database (기존 .env 형식에 맞춤)
-    mysql_host: str = os.getenv("MYSQL_HOST", "localhost")
-    mysql_user: str = os.getenv("MYSQL_USER", "root")
-    mysql_password: str = os.getenv("MYSQL_PASSWORD", "")
-    mysql_db: str = os.getenv("MYSQL_DB", "cliwant")
-    mysql_port: int = int(os.getenv("MYSQL_PORT", "3306"))
-    mysql_pool_size: int = int(os.getenv("MYSQL_POOL_SIZE", "10"))
-    
+    mysql_host: str = "localhost"
+    mysql_user: str = "root"
+    mysql_password: str = ""
+    mysql_db: str = "cliwant"
+    mysql_port: int = 3306
+    mysql_pool_size: int = 10
+    mysql_max_overflow: int = 20
+
     # 읽기 전용 DB 계정 (자연어 SQL 쿼리 실행용)
     # 설정되지 않으면 기본 계정 사용 (경고 로그 출력)
-    mysql_readonly_user: str = os.getenv("MYSQL_READONLY_USER", "")
-    mysql_readonly_password: str = os.getenv("MYSQL_READONLY_PASSWORD", "")
-    
-    @property
-    def database_url(self) -> str:
+    mysql_readonly_user: str = ""
+    mysql_readonly_password: str = ""
+
+    # Security
+    secret_key: str = "your-super-secret-key-change-in-production"
+    api_key: str = "your-admin-api-key"
+
+    # CORS 설정 (쉼표로 구분된 도메인 목록)
+    cors_origins: str = "http://localhost:8000,http://127.0.0.1:8000"
+
+    # Application
+    app_name: str = "Prompt API Engine"
+    debug: bool = True
+
+    # API Engine 설정
+    max_query_timeout: int = 30  # 쿼리 타임아웃 (초)
+    enable_audit_log: bool = True  # 감사 로그 활성화
+    soft_delete_only: bool = True  # 삭제 대신 비활성화만 허용
+
+    @classmethod
+    def from_env(cls) -> "Settings":
+        """환경 변수에서 설정 생성"""
+        return cls(
+            mysql_host=os.getenv("MYSQL_HOST", cls.mysql_host),
+            mysql_user=os.getenv("MYSQL_USER", cls.mysql_user),
+            mysql_password=os.getenv("MYSQL_PASSWORD", cls.mysql_password),
+            mysql_db=os.getenv("MYSQL_DB", cls.mysql_db),
+            mysql_port=int(os.getenv("MYSQL_PORT", str(cls.mysql_port))),
+            mysql_pool_size=int(os.getenv("MYSQL_POOL_SIZE", str(cls.mysql_pool_size))),
+            mysql_max_overflow=int(os.getenv("MYSQL_MAX_OVERFLOW", str(cls.mysql_max_overflow))),
+            mysql_readonly_user=os.getenv("MYSQL_READONLY_USER", cls.mysql_readonly_user),
+            mysql_readonly_password=os.getenv("MYSQL_READONLY_PASSWORD", cls.mysql_readonly_password),
+            secret_key=os.getenv("SECRET_KEY", cls.secret_key),
+            api_key=os.getenv("API_KEY", cls.api_key),
+            cors_origins=os.getenv("CORS_ORIGINS", cls.cors_origins),
+            app_name=os.getenv("APP_NAME", cls.app_name),
+            debug=_env_bool("DEBUG", os.getenv("ENV", "dev") == "dev"),
+            max_query_timeout=int(os.getenv("MAX_QUERY_TIMEOUT", str(cls.max_query_timeout))),
+            enable_audit_log=_env_bool("ENABLE_AUDIT_LOG", cls.enable_audit_log),
+            soft_delete_only=_env_bool("SOFT_DELETE_ONLY", cls.soft_delete_only),
+        )
+
+    def _mysql_url(self, user: str, password: str) -> URL:
+        """aiomysql 연결 URL 객체 생성 (문자열 파싱/비밀번호 이스케이프 불필요)"""
+        return URL.create(
+            drivername="mysql+aiomysql",
+            username=user,
+            password=password,
+            host=self.mysql_host,
+            port=self.mysql_port,
+            database=self.mysql_db,
+        )
+
+    @cached_property
+    def database_url(self) -> URL:
         """SQLAlchemy 비동기 연결 URL 생성 (기본 - 전체 권한)"""
-        return f"mysql+aiomysql://{self.mysql_user}:{self.mysql_password}@{self.mysql_host}:{self.mysql_port}/{self.mysql_db}"
-    
-    @property
-    def readonly_database_url(self) -> str:
+        return self._mysql_url(self.mysql_user, self.mysql_password)
+
+    @cached_property
+    def readonly_database_url(self) -> URL:
         """읽기 전용 DB 연결 URL (자연어 SQL 쿼리용)"""
         # 읽기 전용 계정이 설정되어 있으면 사용, 아니면 기본 계정 사용
         user = self.mysql_readonly_user or self.mysql_user
         password = self.mysql_readonly_password or self.mysql_password
-        return f"mysql+aiomysql://{user}:{password}@{self.mysql_host}:{self.mysql_port}/{self.mysql_db}"
-    
-    @property
+        return self._mysql_url(user, password)
+
+    @cached_property
     def has_readonly_account(self) -> bool:
         """읽기 전용 계정이 설정되어 있는지 확인"""
         return bool(self.mysql_readonly_user and self.mysql_readonly_password)
-    
-    # Security
-    secret_key: str = os.getenv("SECRET_KEY", "your-super-secret-key-change-in-production")
-    api_key: str = os.getenv("API_KEY", "your-admin-api-key")
-    
-    # CORS 설정 (쉼표로 구분된 도메인 목록)
-    cors_origins: str = os.getenv("CORS_ORIGINS", "http://localhost:8000,http://127.0.0.1:8000")
-    
-    @property
+
+    @cached_property
     def cors_origins_list(self) -> list[str]:
         """CORS 허용 도메인 목록 반환"""
         return [origin.strip() for origin in self.cors_origins.split(",") if origin.strip()]
-    
-    # Application
-    app_name: str = "Prompt API Engine"
-    debug: bool = os.getenv("ENV", "dev") == "dev"
-    
-    # API Engine 설정
-    max_query_timeout: int = 30  # 쿼리 타임아웃 (초)
-    enable_audit_log: bool = True  # 감사 로그 활성화
-    soft_delete_only: bool = True  # 삭제 대신 비활성화만 허용
-    
-    class Config:
-        env_file = ".env"
-        env_file_encoding = "utf-8"
-        case_sensitive = False
-        extra = "ignore"
 
 
 @lru_cache()
 def get_settings() -> Settings:
     """설정 싱글톤 반환"""
-    return Settings()
+    # .env가 있을 때만 로드 (import 시점이 아닌 최초 설정 조회 시 한 번)
+    if ENV_FILE.is_file():
+        from dotenv import load_dotenv
+        load_dotenv(ENV_FILE)
+    return Settings.from_env()
@@ -6,32 +6,63 @@
 - 기본 연결: 전체 권한 (API 정의 관리용)
 - 읽기 전용 연결: SELECT만 허용 (자연어 SQL 쿼리용)
 """
+import hashlib
 import logging
+from typing import Optional
+
+import orjson
+from sqlalchemy import Column, Integer, MetaData, String, Table, select
+from sqlalchemy.dialects.mysql import VARCHAR as MYSQL_VARCHAR, insert as mysql_insert
+from sqlalchemy.exc import DBAPIError
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
 from sqlalchemy.orm import declarative_base
+from sqlalchemy.schema import CreateIndex, CreateTable
 from app.core.config import get_settings
+from app.core.request_context import request_sessions
 
 logger = logging.getLogger(__name__)
 settings = get_settings()
 
+# MySQL wait_timeout(기본 8시간)보다 짧게 유지하여 끊긴 연결 재사용 방지
+# 체크아웃마다 SELECT 1을 보내는 pool_pre_ping 대신 주기적 재연결 사용
+POOL_RECYCLE_SECONDS = 1800
+
+# JSON 컬럼(REQ_SPEC, LOGIC_CFG, OLD_VAL 등) 직렬화/역직렬화에 orjson 사용
+# MySQL JSON 타입은 이미 바이너리 형식으로 저장되므로 드라이버와 주고받는 텍스트 변환만 가속
+# datetime/UUID/dataclass는 orjson이 C 레벨에서 직접 직렬화 (naive datetime은 UTC로 간주, "Z" 표기)
+_JSON_DUMPS_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_NAIVE_UTC | orjson.OPT_UTC_Z
+
+
+def _json_serializer(value) -> str:
+    return orjson.dumps(value, default=str, option=_JSON_DUMPS_OPTIONS).decode()
+
+
+_JSON_KWARGS = dict(json_serializer=_json_serializer, json_deserializer=orjson.loads)
+
+# 세션 팩토리 공통 설정 (두 연결은 바인딩된 엔진/풀 설정만 다름)
+_SESSION_KWARGS = dict(
+    class_=AsyncSession,
+    expire_on_commit=False,
+    autocommit=False,
+    autoflush=False,
+)
+
 # ========================================
 # 기본 DB 연결 (전체 권한)
 # ========================================
 engine = create_async_engine(
     settings.database_url,
+    **_JSON_KWARGS,
     echo=settings.debug,
-    pool_pre_ping=True,
-    pool_size=10,
-    max_overflow=20,
+    pool_pre_ping=False,
+    pool_recycle=POOL_RECYCLE_SECONDS,
+    pool_size=settings.mysql_pool_size,
+    max_overflow=settings.mysql_max_overflow,
+    # 가장 최근에 반납된(살아 있는) 연결부터 재사용, 한가할 때 남는 연결은 recycle로 정리
+    pool_use_lifo=True,
 )
 
-async_session_maker = async_sessionmaker(
-    engine,
-    class_=AsyncSession,
-    expire_on_commit=False,
-    autocommit=False,
-    autoflush=False,
-)
+async_session_maker = async_sessionmaker(engine, **_SESSION_KWARGS)
 
 # ========================================
 # 읽기 전용 DB 연결 (SELECT만 허용)
@@ -39,19 +70,15 @@ async_session_maker = async_sessionmaker(
 # ========================================
 readonly_engine = create_async_engine(
     settings.readonly_database_url,
+    **_JSON_KWARGS,
     echo=settings.debug,
-    pool_pre_ping=True,
-    pool_size=5,  # 읽기 전용은 작은 풀 사용
-    max_overflow=10,
+    pool_pre_ping=True,  # 사용 빈도가 낮아 유휴 연결이 끊겨 있을 수 있음
+    pool_recycle=POOL_RECYCLE_SECONDS,
+    pool_size=max(2, settings.mysql_pool_size // 2),  # 읽기 전용은 작은 풀 사용
+    max_overflow=max(2, settings.mysql_max_overflow // 2),
 )
 
-readonly_session_maker = async_sessionmaker(
-    readonly_engine,
-    class_=AsyncSession,
-    expire_on_commit=False,
-    autocommit=False,
-    autoflush=False,
-)
+readonly_session_maker = async_sessionmaker(readonly_engine, **_SESSION_KWARGS)
 
 # 읽기 전용 계정 설정 여부 경고
 if not settings.has_readonly_account:
@@ -66,10 +93,24 @@ else:
 # Base 클래스
 Base = declarative_base()
 
+# 식별자 컬럼 타입 (ROUTE_ID, VERSION_ID, AUDIT_ID, TRGT_ID)
+# UUID 문자열은 ASCII만 사용하므로 MySQL에서는 ascii/ascii_bin으로 저장하여
+# 인덱스 키를 줄이고 utf8mb4_unicode_ci 대신 바이트 단위 비교를 사용
+IdString = String(50).with_variant(MYSQL_VARCHAR(50, charset="ascii", collation="ascii_bin"), "mysql")
+
 
+# 같은 요청 안의 get_db / get_readonly_db는 request_context의 세션 슬롯으로 세션을 공유
 async def get_db() -> AsyncSession:
     """의존성 주입용 DB 세션 제공 (전체 권한)"""
+    slots = request_sessions.get()
+    if slots is not None and slots.default is not None:
+        # 같은 요청에서 이미 열린 세션 재사용 (커밋/롤백은 최초 소유자가 처리)
+        yield slots.default
+        return
+
     async with async_session_maker() as session:
+        if slots is not None:
+            slots.default = session
         try:
             yield session
             await session.commit()
@@ -77,6 +118,8 @@ async def get_db() -> AsyncSession:
             await session.rollback()
             raise
         finally:
+            if slots is not None:
+                slots.default = None
             await session.close()
 
 
@@ -93,7 +136,14 @@ async def get_readonly_db() -> AsyncSession:
     - commit()이 호출되지 않음
     - DDL/DML 실행 불가 (DB 계정 권한으로 제한)
     """
+    slots = request_sessions.get()
+    if slots is not None and slots.readonly is not None:
+        yield slots.readonly
+        return
+
     async with readonly_session_maker() as session:
+        if slots is not None:
+            slots.readonly = session
         try:
             yield session
             # 읽기 전용이므로 commit하지 않음
@@ -101,11 +151,88 @@ async def get_readonly_db() -> AsyncSession:
             await session.rollback()
             raise
         finally:
+            if slots is not None:
+                slots.readonly = None
             await session.close()
 
 
+async def run_in_side_session(fn, *args, **kwargs):
+    """
+    별도 세션에서 조회 함수 실행 (fn(session, *args, **kwargs))
+    
+    하나의 세션(연결)에서는 쿼리를 동시에 실행할 수 없으므로,
+    요청 세션과 asyncio.gather로 병렬 조회할 때 사용합니다.
+    커밋하지 않으므로 조회 용도로만 사용하세요.
+    """
+    async with async_session_maker() as session:
+        return await fn(session, *args, **kwargs)
+
+
+# ========================================
+# 스키마 버전 센티널
+# 테이블/인덱스 정의(DDL)가 바뀌지 않았으면 create_all(테이블별 존재 확인)을 건너뜀
+# ========================================
+_schema_meta = MetaData()
+_schema_version = Table(
+    "_schema_version",
+    _schema_meta,
+    Column("id", Integer, primary_key=True, autoincrement=False),
+    Column("version", String(64), nullable=False),
+)
+
+
+def _metadata_hash() -> str:
+    """
+    Base.metadata의 DDL로 안정적인 해시 생성
+
+    실제 DB 방언으로 컴파일한 CREATE TABLE / CREATE INDEX 문을 사용하므로
+    컬럼 타입, 가상 컬럼(Computed), 인덱스 변경도 해시에 반영됩니다.
+    """
+    digest = hashlib.sha256()
+    for name in sorted(Base.metadata.tables):
+        table = Base.metadata.tables[name]
+        digest.update(str(CreateTable(table).compile(dialect=engine.dialect)).encode())
+        for index in sorted(table.indexes, key=lambda i: i.name or ""):
+            digest.update(str(CreateIndex(index).compile(dialect=engine.dialect)).encode())
+        digest.update(b";")
+    return digest.hexdigest()
+
+
+async def _stored_schema_version() -> Optional[str]:
+    """저장된 스키마 버전 조회 (센티널 테이블이 없으면 None)"""
+    try:
+        async with engine.connect() as conn:
+            result = await conn.execute(
+                select(_schema_version.c.version).where(_schema_version.c.id == 1)
+            )
+            return result.scalar_one_or_none()
+    except DBAPIError:
+        return None
+
+
 async def init_db():
-    """데이터베이스 테이블 초기화"""
+    """
+    데이터베이스 테이블 초기화
+
+    저장된 스키마 버전이 현재 모델 해시와 같으면 쿼리 1회로 종료하고,
+    다르면 create_all 실행 후 버전을 갱신합니다.
+    """
+    version = _metadata_hash()
+    stored = await _stored_schema_version()
+    if stored == version:
+        logger.info("스키마 변경 없음 - create_all 생략")
+        return
+    if stored is not None:
+        # create_all은 없는 테이블만 생성하므로 기존 테이블의 컬럼/인덱스 변경은 반영되지 않음
+        logger.warning(
+            "모델 스키마 정의가 변경되었습니다 (%s → %s). 기존 테이블 변경은 scripts/의 마이그레이션으로 적용하세요.",
+            stored[:12],
+            version[:12],
+        )
+
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
-
+        await conn.run_sync(_schema_meta.create_all)
+        stmt = mysql_insert(_schema_version).values(id=1, version=version)
+        await conn.execute(stmt.on_duplicate_key_update(version=stmt.inserted.version))
+    logger.info("스키마 초기화 완료 (version=%s)", version[:12])
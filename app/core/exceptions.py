@@ -4,6 +4,7 @@
 이 모듈은 API에서 발생할 수 있는 다양한 예외를 정의하고
 사용자 친화적인 에러 메시지를 제공합니다.
 """
+import sys
 from typing import Optional, Any
 from fastapi import HTTPException
 
@@ -11,6 +12,8 @@ from fastapi import HTTPException
 class ApiEngineError(Exception):
     """API 엔진 기본 예외 클래스"""
     
+    __slots__ = ("message", "error_code", "status_code", "details")
+    
     def __init__(
         self,
         message: str,
@@ -19,18 +22,14 @@ class ApiEngineError(Exception):
         details: Optional[dict[str, Any]] = None,
     ):
         self.message = message
-        self.error_code = error_code
+        self.error_code = sys.intern(error_code)
         self.status_code = status_code
         self.details = details or {}
         super().__init__(message)
     
     def to_dict(self) -> dict:
-        """에러를 딕셔너리로 변환"""
-        result = {
-            "success": False,
-            "error": self.error_code,
-            "message": self.message,
-        }
+        """에러를 딕셔너리로 변환 (호출마다 새 딕셔너리 반환, details는 있을 때만 포함)"""
+        result = {"success": False, "error": self.error_code, "message": self.message}
         if self.details:
             result["details"] = self.details
         return result
@@ -39,6 +38,8 @@ class ApiEngineError(Exception):
 class ValidationError(ApiEngineError):
     """유효성 검증 오류"""
     
+    __slots__ = ()
+    
     def __init__(self, message: str, field: Optional[str] = None, details: Optional[dict] = None):
         super().__init__(
             message=message,
@@ -51,6 +52,8 @@ class ValidationError(ApiEngineError):
 class NotFoundError(ApiEngineError):
     """리소스를 찾을 수 없음"""
     
+    __slots__ = ()
+    
     def __init__(self, resource: str, identifier: Any = None):
         message = f"{resource}을(를) 찾을 수 없습니다."
         if identifier:
@@ -66,6 +69,8 @@ class NotFoundError(ApiEngineError):
 class DuplicateError(ApiEngineError):
     """중복 데이터 오류"""
     
+    __slots__ = ()
+    
     def __init__(self, resource: str, field: str, value: Any):
         super().__init__(
             message=f"이미 존재하는 {resource}입니다: {field}={value}",
@@ -78,6 +83,8 @@ class DuplicateError(ApiEngineError):
 class AuthenticationError(ApiEngineError):
     """인증 오류"""
     
+    __slots__ = ()
+    
     def __init__(self, message: str = "인증이 필요합니다."):
         super().__init__(
             message=message,
@@ -89,6 +96,8 @@ class AuthenticationError(ApiEngineError):
 class AuthorizationError(ApiEngineError):
     """권한 오류"""
     
+    __slots__ = ()
+    
     def __init__(self, message: str = "이 작업을 수행할 권한이 없습니다."):
         super().__init__(
             message=message,
@@ -100,6 +109,8 @@ class AuthorizationError(ApiEngineError):
 class ExecutionError(ApiEngineError):
     """로직 실행 오류"""
     
+    __slots__ = ()
+    
     def __init__(self, message: str, logic_type: Optional[str] = None, details: Optional[dict] = None):
         super().__init__(
             message=message,
@@ -112,6 +123,8 @@ class ExecutionError(ApiEngineError):
 class SecurityError(ApiEngineError):
     """보안 오류 (SQL Injection 등)"""
     
+    __slots__ = ()
+    
     def __init__(self, message: str, threat_type: str = "UNKNOWN"):
         super().__init__(
             message=message,
@@ -124,6 +137,8 @@ class SecurityError(ApiEngineError):
 class DatabaseError(ApiEngineError):
     """데이터베이스 오류"""
     
+    __slots__ = ()
+    
     def __init__(self, message: str = "데이터베이스 오류가 발생했습니다.", details: Optional[dict] = None):
         super().__init__(
             message=message,
@@ -136,6 +151,8 @@ class DatabaseError(ApiEngineError):
 class ExternalServiceError(ApiEngineError):
     """외부 서비스 오류"""
     
+    __slots__ = ()
+    
     def __init__(self, service: str, message: str, details: Optional[dict] = None):
         super().__init__(
             message=f"{service} 서비스 오류: {message}",
@@ -148,6 +165,8 @@ class ExternalServiceError(ApiEngineError):
 class RateLimitError(ApiEngineError):
     """요청 제한 오류"""
     
+    __slots__ = ()
+    
     def __init__(self, message: str = "요청 한도를 초과했습니다. 잠시 후 다시 시도해주세요."):
         super().__init__(
             message=message,
@@ -159,6 +178,8 @@ class RateLimitError(ApiEngineError):
 class ImmutablePolicyError(ApiEngineError):
     """불변 정책 위반 오류"""
     
+    __slots__ = ()
+    
     def __init__(self, action: str, resource: str):
         super().__init__(
             message=f"불변 정책: {resource}에 대해 '{action}' 작업은 허용되지 않습니다.",
@@ -169,7 +190,8 @@ class ImmutablePolicyError(ApiEngineError):
 
 
 # 에러 코드 → 사용자 친화적 메시지 매핑
-ERROR_MESSAGES = {
+# 키는 intern하여 ApiEngineError.error_code와 포인터 비교로 매칭되도록 함
+ERROR_MESSAGES = {sys.intern(code): message for code, message in {
     "INTERNAL_ERROR": "서버 내부 오류가 발생했습니다. 잠시 후 다시 시도해주세요.",
     "VALIDATION_ERROR": "입력값이 올바르지 않습니다.",
     "NOT_FOUND": "요청한 리소스를 찾을 수 없습니다.",
@@ -182,9 +204,12 @@ ERROR_MESSAGES = {
     "EXTERNAL_SERVICE_ERROR": "외부 서비스 연동 중 오류가 발생했습니다.",
     "RATE_LIMIT_ERROR": "요청 한도를 초과했습니다. 잠시 후 다시 시도해주세요.",
     "IMMUTABLE_POLICY_VIOLATION": "불변 정책에 의해 이 작업은 허용되지 않습니다.",
-}
+}.items()}
+
+_DEFAULT_MSG = ERROR_MESSAGES["INTERNAL_ERROR"]
+_lookup = ERROR_MESSAGES.get
 
 
 def get_user_friendly_message(error_code: str) -> str:
     """에러 코드에 대한 사용자 친화적 메시지 반환"""
-    return ERROR_MESSAGES.get(error_code, ERROR_MESSAGES["INTERNAL_ERROR"])
+    return _lookup(error_code, _DEFAULT_MSG)
@@ -3,17 +3,24 @@
 
 JSON 형식의 구조화된 로그와 요청/응답 추적을 제공합니다.
 """
+import asyncio
+import atexit
+import itertools
 import logging
-import json
+import queue
+import re
+import secrets
 import time
-import uuid
-from datetime import datetime
 from typing import Any, Optional
 from functools import wraps
+from logging.handlers import QueueHandler, QueueListener
 
+import orjson
 from fastapi import Request, Response
 from starlette.middleware.base import BaseHTTPMiddleware
 
+from app.core.request_context import request_session_scope
+
 
 # JSON 로그 포매터
 class JSONFormatter(logging.Formatter):
@@ -21,7 +28,8 @@ class JSONFormatter(logging.Formatter):
     
     def format(self, record: logging.LogRecord) -> str:
         log_data = {
-            "timestamp": datetime.utcnow().isoformat() + "Z",
+            # record.created는 로깅 모듈이 이미 계산한 값이므로 재사용
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(record.created)) + f".{int(record.msecs):03d}Z",
             "level": record.levelname,
             "logger": record.name,
             "message": record.getMessage(),
@@ -49,7 +57,39 @@ class JSONFormatter(logging.Formatter):
         if record.exc_info:
             log_data["exception"] = self.formatException(record.exc_info)
         
-        return json.dumps(log_data, ensure_ascii=False)
+        # orjson은 UTF-8 bytes를 바로 생성 (직렬화 불가 타입은 str로 변환)
+        return orjson.dumps(log_data, default=str, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
+class _DeferredQueueHandler(QueueHandler):
+    """
+    큐 핸들러 (요청 처리 스레드에서는 메시지 병합만 수행)
+    
+    JSON 포매팅과 stderr 쓰기는 QueueListener 스레드에서 처리합니다.
+    """
+    
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+
+# 로거 이름 → 백그라운드 리스너
+_listeners: dict[str, QueueListener] = {}
+# 실행 중인 리스너의 로거 이름
+_running: set[str] = set()
+
+
+def _start_listener(name: str) -> None:
+    if name not in _running:
+        _listeners[name].start()
+        _running.add(name)
+
+
+def _stop_listener(name: str) -> None:
+    if name in _running:
+        _running.discard(name)
+        _listeners[name].stop()
 
 
 # 로거 설정
@@ -65,7 +105,10 @@ def setup_logger(
     # 기존 핸들러 제거
     logger.handlers.clear()
     
-    # 콘솔 핸들러
+    # 자체 큐 핸들러가 있으므로 상위 로거(api_engine)로 전파하지 않음 (중복 출력 방지)
+    logger.propagate = False
+    
+    # 콘솔 핸들러 (리스너 스레드에서 실행)
     handler = logging.StreamHandler()
     handler.setLevel(level)
     
@@ -76,13 +119,66 @@ def setup_logger(
             "%(asctime)s | %(levelname)s | %(name)s | %(message)s"
         ))
     
-    logger.addHandler(handler)
+    # 로거에는 큐 핸들러만 연결
+    log_queue = queue.SimpleQueue()
+    logger.addHandler(_DeferredQueueHandler(log_queue))
+    
+    # 기존 리스너는 남은 로그를 기록한 뒤 교체
+    # (앱 시작 전 import 시점 경고, scripts/ 도구의 로그도 바로 출력되도록 즉시 시작)
+    if name in _listeners:
+        _stop_listener(name)
+    _listeners[name] = QueueListener(log_queue, handler, respect_handler_level=True)
+    _start_listener(name)
     return logger
 
 
+def start_log_listeners() -> None:
+    """중지된 로그 리스너 스레드 재시작 (애플리케이션 시작 시 호출)"""
+    for name in list(_listeners):
+        _start_listener(name)
+
+
+def stop_log_listeners() -> None:
+    """로그 리스너 스레드 종료 (남은 로그를 모두 기록한 뒤 종료)"""
+    for name in list(_running):
+        _stop_listener(name)
+
+
+# 애플리케이션 lifespan을 거치지 않는 종료(스크립트, 시작 실패)에서도 큐에 남은 로그 기록
+atexit.register(stop_log_listeners)
+
+
+class BoundLogger(logging.LoggerAdapter):
+    """
+    요청 컨텍스트(request_id, method 등)를 한 번 바인딩해 두는 로거 어댑터
+    
+    호출 시 전달한 extra는 바인딩된 값 위에 병합됩니다.
+    """
+    
+    def process(self, msg, kwargs):
+        extra = kwargs.get("extra")
+        kwargs["extra"] = {**self.extra, **extra} if extra else self.extra
+        return msg, kwargs
+
+
 # 기본 로거
 logger = setup_logger()
 
+# SQL 첫 키워드 추출용 (쿼리 전체를 split하지 않음)
+_FIRST_TOKEN_RE = re.compile(r"\s*(\S+)")
+
+
+def _first_token_upper(query: str) -> str:
+    """쿼리의 첫 단어를 대문자로 반환 (없으면 UNKNOWN)"""
+    match = _FIRST_TOKEN_RE.match(query)
+    return match.group(1).upper() if match else "UNKNOWN"
+
+# 요청 ID 생성용 (워커별 4바이트 랜덤 접두사 + 단조 증가 카운터)
+# 요청마다 uuid4()로 urandom을 읽지 않고 16자리 이상의 토큰을 만듭니다.
+# 카운터는 자르지 않으므로 같은 워커 안에서 ID가 반복되지 않습니다.
+_PROC_PREFIX = secrets.token_hex(4)
+_REQ_COUNTER = itertools.count()
+
 
 class RequestLoggingMiddleware(BaseHTTPMiddleware):
     """요청/응답 로깅 미들웨어"""
@@ -93,24 +189,29 @@ class RequestLoggingMiddleware(BaseHTTPMiddleware):
     
     async def dispatch(self, request: Request, call_next) -> Response:
         # 요청 ID 생성
-        request_id = str(uuid.uuid4())[:8]
+        request_id = f"{_PROC_PREFIX}{next(_REQ_COUNTER):08x}"
         request.state.request_id = request_id
         
-        # 시작 시간
-        start_time = time.time()
+        # 시작 시간 (단조 증가 정수 나노초)
+        start_ns = time.perf_counter_ns()
         
         # 클라이언트 정보
         client_ip = request.client.host if request.client else "unknown"
         user_agent = request.headers.get("user-agent", "unknown")
         
+        # 요청 컨텍스트를 한 번만 바인딩 (로그 호출마다 공통 키를 다시 만들지 않음)
+        req_log = BoundLogger(self.logger, {
+            "request_id": request_id,
+            "method": request.method,
+            "path": request.url.path,
+            "client_ip": client_ip,
+        })
+        request.state.logger = req_log
+        
         # 요청 로그
-        self.logger.info(
+        req_log.info(
             f"→ {request.method} {request.url.path}",
             extra={
-                "request_id": request_id,
-                "method": request.method,
-                "path": request.url.path,
-                "client_ip": client_ip,
                 "user_agent": user_agent,
                 "extra_data": {
                     "query_params": str(request.query_params) if request.query_params else None,
@@ -118,46 +219,39 @@ class RequestLoggingMiddleware(BaseHTTPMiddleware):
             }
         )
         
-        # 응답 처리
+        # 응답 처리 (요청 단위 DB 세션 슬롯 안에서 실행)
         try:
-            response = await call_next(request)
-            duration_ms = round((time.time() - start_time) * 1000, 2)
+            async with request_session_scope():
+                response = await call_next(request)
+            duration_ms = (time.perf_counter_ns() - start_ns) / 1_000_000
             
             # 응답 로그
             level = logging.INFO if response.status_code < 400 else logging.WARNING
             if response.status_code >= 500:
                 level = logging.ERROR
             
-            self.logger.log(
+            req_log.log(
                 level,
-                f"← {response.status_code} ({duration_ms}ms)",
+                f"← {response.status_code} ({duration_ms:.2f}ms)",
                 extra={
-                    "request_id": request_id,
-                    "method": request.method,
-                    "path": request.url.path,
                     "status_code": response.status_code,
                     "duration_ms": duration_ms,
-                    "client_ip": client_ip,
                 }
             )
             
             # 응답 헤더에 요청 ID 추가
             response.headers["X-Request-ID"] = request_id
-            response.headers["X-Response-Time"] = f"{duration_ms}ms"
+            response.headers["X-Response-Time"] = f"{duration_ms:.2f}ms"
             
             return response
             
         except Exception as e:
-            duration_ms = round((time.time() - start_time) * 1000, 2)
+            duration_ms = (time.perf_counter_ns() - start_ns) / 1_000_000
             
-            self.logger.error(
-                f"✗ Error: {str(e)} ({duration_ms}ms)",
+            req_log.error(
+                f"✗ Error: {str(e)} ({duration_ms:.2f}ms)",
                 extra={
-                    "request_id": request_id,
-                    "method": request.method,
-                    "path": request.url.path,
                     "duration_ms": duration_ms,
-                    "client_ip": client_ip,
                     "extra_data": {"error": str(e)}
                 },
                 exc_info=True,
@@ -226,6 +320,10 @@ class APICallLogger:
         request_id: Optional[str] = None,
     ):
         """SQL 실행 로그"""
+        # DEBUG 비활성화 시(운영 환경) 요약/딕셔너리 생성 생략
+        if not self.logger.isEnabledFor(logging.DEBUG):
+            return
+        
         # 쿼리 요약 (첫 100자)
         query_summary = query[:100] + "..." if len(query) > 100 else query
         query_summary = query_summary.replace("\n", " ").strip()
@@ -236,7 +334,7 @@ class APICallLogger:
                 "request_id": request_id,
                 "duration_ms": duration_ms,
                 "extra_data": {
-                    "query_type": query.strip().split()[0].upper() if query.strip() else "UNKNOWN",
+                    "query_type": _first_token_upper(query),
                     "row_count": row_count,
                     "param_count": len(params),
                 }
@@ -247,38 +345,46 @@ class APICallLogger:
 # 전역 API 콜 로거
 api_logger = APICallLogger()
 
+_is_coroutine_function = asyncio.iscoroutinefunction
+
 
 def log_execution(func):
     """실행 시간 로깅 데코레이터"""
-    @wraps(func)
-    async def async_wrapper(*args, **kwargs):
-        start_time = time.time()
-        try:
-            result = await func(*args, **kwargs)
-            duration_ms = round((time.time() - start_time) * 1000, 2)
-            logger.debug(
-                f"{func.__name__} 실행 완료 ({duration_ms}ms)",
-                extra={"duration_ms": duration_ms}
-            )
-            return result
-        except Exception as e:
-            duration_ms = round((time.time() - start_time) * 1000, 2)
-            logger.error(
-                f"{func.__name__} 실행 실패: {str(e)} ({duration_ms}ms)",
-                extra={"duration_ms": duration_ms, "extra_data": {"error": str(e)}},
-            )
-            raise
+    # 데코레이션 시점에 한 번만 판별하여 필요한 래퍼만 생성
+    if _is_coroutine_function(func):
+        @wraps(func)
+        async def async_wrapper(*args, **kwargs):
+            start_time = time.time()
+            try:
+                result = await func(*args, **kwargs)
+                if logger.isEnabledFor(logging.DEBUG):
+                    duration_ms = round((time.time() - start_time) * 1000, 2)
+                    logger.debug(
+                        f"{func.__name__} 실행 완료 ({duration_ms}ms)",
+                        extra={"duration_ms": duration_ms}
+                    )
+                return result
+            except Exception as e:
+                duration_ms = round((time.time() - start_time) * 1000, 2)
+                logger.error(
+                    f"{func.__name__} 실행 실패: {str(e)} ({duration_ms}ms)",
+                    extra={"duration_ms": duration_ms, "extra_data": {"error": str(e)}},
+                )
+                raise
+        
+        return async_wrapper
     
     @wraps(func)
     def sync_wrapper(*args, **kwargs):
         start_time = time.time()
         try:
             result = func(*args, **kwargs)
-            duration_ms = round((time.time() - start_time) * 1000, 2)
-            logger.debug(
-                f"{func.__name__} 실행 완료 ({duration_ms}ms)",
-                extra={"duration_ms": duration_ms}
-            )
+            if logger.isEnabledFor(logging.DEBUG):
+                duration_ms = round((time.time() - start_time) * 1000, 2)
+                logger.debug(
+                    f"{func.__name__} 실행 완료 ({duration_ms}ms)",
+                    extra={"duration_ms": duration_ms}
+                )
             return result
         except Exception as e:
             duration_ms = round((time.time() - start_time) * 1000, 2)
@@ -288,7 +394,4 @@ def log_execution(func):
             )
             raise
     
-    import asyncio
-    if asyncio.iscoroutinefunction(func):
-        return async_wrapper
     return sync_wrapper
@@ -0,0 +1,38 @@
+"""
+요청 단위 DB 세션 슬롯
+
+RequestLoggingMiddleware가 요청마다 슬롯을 열고, 같은 요청 안의
+get_db / get_readonly_db 의존성은 먼저 만들어진 세션을 재사용합니다.
+(엔진을 만들지 않으므로 미들웨어와 database 모듈 양쪽에서 가볍게 import)
+"""
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from typing import Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+class RequestSessions:
+    """요청 하나에서 공유되는 세션 슬롯 (세션은 처음 필요할 때 생성)"""
+    __slots__ = ("default", "readonly")
+
+    def __init__(self):
+        self.default: Optional[AsyncSession] = None
+        self.readonly: Optional[AsyncSession] = None
+
+
+request_sessions: ContextVar[Optional[RequestSessions]] = ContextVar("db_sessions", default=None)
+
+
+@asynccontextmanager
+async def request_session_scope():
+    """요청 처리 구간 동안 세션 슬롯을 설정하고, 종료 시 남은 세션을 닫음"""
+    slots = RequestSessions()
+    token = request_sessions.set(slots)
+    try:
+        yield slots
+    finally:
+        request_sessions.reset(token)
+        for session in (slots.default, slots.readonly):
+            if session is not None:
+                await session.close()
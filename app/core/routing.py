@@ -0,0 +1,65 @@
+"""
+라우트 디스패치 최적화
+
+Starlette 라우터는 요청마다 등록된 라우트를 순서대로 정규식 매칭합니다.
+경로 파라미터가 없는 고정 경로(/health, /info, /admin/stats 등)는
+(메서드, 경로) 딕셔너리로 한 번에 찾고, 나머지는 기존 매칭으로 처리합니다.
+"""
+from starlette.routing import Match, Route, Router, get_route_path
+from starlette.types import Receive, Scope, Send
+
+
+def _build_fast_table(router: Router) -> dict[tuple[str, str], Route]:
+    """
+    고정 경로 라우트 테이블 생성
+
+    앞선 라우트(파라미터 경로 등)가 같은 요청을 먼저 가져가는 경우는
+    기존 매칭 순서를 유지하기 위해 테이블에서 제외합니다.
+    """
+    table: dict[tuple[str, str], Route] = {}
+    routes = router.routes
+
+    for index, route in enumerate(routes):
+        if not isinstance(route, Route) or "{" in route.path or not route.methods:
+            continue
+
+        for method in route.methods:
+            key = (method, route.path)
+            if key in table:
+                continue
+
+            probe = {"type": "http", "path": route.path, "root_path": "", "method": method}
+            shadowed = any(
+                earlier.matches(probe)[0] != Match.NONE for earlier in routes[:index]
+            )
+            if not shadowed:
+                table[key] = route
+
+    return table
+
+
+def install_fast_dispatch(router: Router) -> int:
+    """
+    라우터에 고정 경로 우선 디스패치 설치 (모든 라우트 등록 후 호출)
+
+    Returns:
+        테이블에 등록된 (메서드, 경로) 수
+    """
+    table = _build_fast_table(router)
+    fallback = router.app
+
+    async def dispatch(scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http":
+            route = table.get((scope["method"], get_route_path(scope)))
+            if route is not None:
+                match, child_scope = route.matches(scope)
+                if match == Match.FULL:
+                    if "router" not in scope:
+                        scope["router"] = router
+                    scope.update(child_scope)
+                    await route.handle(scope, receive, send)
+                    return
+        await fallback(scope, receive, send)
+
+    router.middleware_stack = dispatch
+    return len(table)
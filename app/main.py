@@ -9,12 +9,17 @@ MySQL 테이블 행 추가/수정만으로 API를 생성/수정하는 동적 API
 - 감사 로그를 통한 변경 이력 추적
 - SQL Injection 방지 및 보안 기능
 """
+import hashlib
+import logging
 from contextlib import asynccontextmanager
+from functools import lru_cache
 from pathlib import Path
+from typing import Optional
 
-from fastapi import FastAPI, Request
+import orjson
+from fastapi import FastAPI, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse, FileResponse
+from fastapi.responses import ORJSONResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.exceptions import RequestValidationError
 from pydantic import ValidationError as PydanticValidationError
@@ -33,13 +38,24 @@ from app.core.exceptions import (
     DatabaseError,
     get_user_friendly_message,
 )
-from app.core.logging import RequestLoggingMiddleware, logger
+from app.core.logging import (
+    RequestLoggingMiddleware,
+    logger,
+    start_log_listeners,
+    stop_log_listeners,
+)
+from app.core.routing import install_fast_dispatch
 from app.routers import universal_router, admin_router, health_router
 from app.routers.schema_router import router as schema_router
 
 # 정적 파일 경로
 STATIC_DIR = Path(__file__).parent / "static"
 
+# API 테스터 UI (정적 파일이므로 한 번만 읽어 메모리에서 응답)
+_INDEX_HTML = (STATIC_DIR / "index.html").read_bytes()
+_INDEX_ETAG = f'"{hashlib.md5(_INDEX_HTML).hexdigest()}"'
+_INDEX_HEADERS = {"ETag": _INDEX_ETAG, "Cache-Control": "public, max-age=300"}
+
 settings = get_settings()
 
 
@@ -47,6 +63,7 @@ settings = get_settings()
 async def lifespan(app: FastAPI):
     """애플리케이션 생명주기 관리"""
     # Startup
+    start_log_listeners()
     print("🚀 Prompt API Engine 시작 중...")
     await init_db()
     print("✅ 데이터베이스 초기화 완료")
@@ -56,6 +73,7 @@ async def lifespan(app: FastAPI):
     
     # Shutdown
     print("👋 서버 종료 중...")
+    stop_log_listeners()
 
 
 # FastAPI 앱 생성
@@ -81,6 +99,7 @@ MySQL 테이블 행 추가/수정만으로 API를 생성하고 관리하는 동
     """,
     version="1.0.0",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,  # 모든 JSON 응답을 orjson으로 직렬화
 )
 
 # 요청/응답 로깅 미들웨어
@@ -105,20 +124,58 @@ app.add_middleware(
 # 예외 핸들러
 # ==================================
 
+_MSG_PLACEHOLDER = b'"__MSG__"'
+
+
+# 운영 모드 내부 오류 응답은 항상 같으므로 본문 전체를 미리 직렬화
+_INTERNAL_ERROR_BODY = orjson.dumps({
+    "success": False,
+    "error": "INTERNAL_ERROR",
+    "message": get_user_friendly_message("INTERNAL_ERROR"),
+})
+
+
+@lru_cache(maxsize=256)
+def _error_template(error_code: str) -> bytes:
+    """에러 코드별 JSON 골격 (message 자리는 플레이스홀더)"""
+    return orjson.dumps({"success": False, "error": error_code, "message": "__MSG__"})
+
+
+def _error_response(
+    status_code: int,
+    error_code: str,
+    message: str,
+    details: Optional[dict] = None,
+) -> Response:
+    """캐시된 골격에 message/details만 끼워 넣어 에러 응답 생성"""
+    body = _error_template(error_code).replace(_MSG_PLACEHOLDER, orjson.dumps(message), 1)
+    if details is not None:
+        body = body[:-1] + b',"details":' + orjson.dumps(details, default=str) + b"}"
+    return Response(content=body, status_code=status_code, media_type="application/json")
+
+
+def _loc_str(loc) -> str:
+    """오류 위치(loc 튜플)를 'body.field' 형태 문자열로 변환"""
+    return ".".join(map(str, loc))
+
+
 @app.exception_handler(ApiEngineError)
 async def api_engine_error_handler(request: Request, exc: ApiEngineError):
     """API 엔진 커스텀 예외 처리"""
-    logger.warning(
-        f"API Error: {exc.error_code} - {exc.message}",
-        extra={
-            "extra_data": {
-                "error_code": exc.error_code,
-                "status_code": exc.status_code,
-                "details": exc.details,
+    if logger.isEnabledFor(logging.WARNING):
+        logger.warning(
+            "API Error: %s - %s",
+            exc.error_code,
+            exc.message,
+            extra={
+                "extra_data": {
+                    "error_code": exc.error_code,
+                    "status_code": exc.status_code,
+                    "details": exc.details,
+                }
             }
-        }
-    )
-    return JSONResponse(
+        )
+    return ORJSONResponse(
         status_code=exc.status_code,
         content=exc.to_dict(),
     )
@@ -129,34 +186,26 @@ async def validation_exception_handler(request: Request, exc: RequestValidationE
     """FastAPI 요청 유효성 검증 오류 처리"""
     errors = exc.errors()
     
-    # 첫 번째 오류의 상세 정보
-    first_error = errors[0] if errors else {}
-    field = ".".join(str(loc) for loc in first_error.get("loc", []))
-    message = first_error.get("msg", "입력값이 올바르지 않습니다.")
+    # 한 번의 순회로 필드 경로 문자열을 만들고 첫 번째 오류 정보도 함께 추출
+    items = [
+        {"field": _loc_str(err.get("loc", ())), "message": err.get("msg"), "type": err.get("type")}
+        for err in errors
+    ]
+    field = items[0]["field"] if items else ""
+    message = (errors[0].get("msg") if errors else None) or "입력값이 올바르지 않습니다."
     
     logger.warning(
-        f"Validation Error: {field} - {message}",
+        "Validation Error: %s - %s",
+        field,
+        message,
         extra={"extra_data": {"errors": errors}}
     )
     
-    return JSONResponse(
-        status_code=400,
-        content={
-            "success": False,
-            "error": "VALIDATION_ERROR",
-            "message": f"입력값 오류: {message}",
-            "details": {
-                "field": field,
-                "errors": [
-                    {
-                        "field": ".".join(str(loc) for loc in err.get("loc", [])),
-                        "message": err.get("msg"),
-                        "type": err.get("type"),
-                    }
-                    for err in errors
-                ],
-            },
-        },
+    return _error_response(
+        400,
+        "VALIDATION_ERROR",
+        f"입력값 오류: {message}",
+        {"field": field, "errors": items},
     )
 
 
@@ -166,25 +215,18 @@ async def pydantic_validation_handler(request: Request, exc: PydanticValidationE
     errors = exc.errors()
     
     first_error = errors[0] if errors else {}
-    field = ".".join(str(loc) for loc in first_error.get("loc", []))
+    field = _loc_str(first_error.get("loc", ()))
     message = first_error.get("msg", "데이터 형식이 올바르지 않습니다.")
     
-    return JSONResponse(
-        status_code=400,
-        content={
-            "success": False,
-            "error": "VALIDATION_ERROR",
-            "message": f"데이터 형식 오류: {message}",
-            "details": {"field": field},
-        },
-    )
+    return _error_response(400, "VALIDATION_ERROR", f"데이터 형식 오류: {message}", {"field": field})
 
 
 @app.exception_handler(SQLAlchemyError)
 async def sqlalchemy_error_handler(request: Request, exc: SQLAlchemyError):
     """SQLAlchemy 데이터베이스 오류 처리"""
     logger.error(
-        f"Database Error: {str(exc)}",
+        "Database Error: %s",
+        exc,
         extra={"extra_data": {"error_type": type(exc).__name__}},
         exc_info=True,
     )
@@ -193,26 +235,21 @@ async def sqlalchemy_error_handler(request: Request, exc: SQLAlchemyError):
     if settings.debug:
         message = f"데이터베이스 오류: {str(exc)[:200]}"
     
-    return JSONResponse(
-        status_code=500,
-        content={
-            "success": False,
-            "error": "DATABASE_ERROR",
-            "message": message,
-        },
-    )
+    return _error_response(500, "DATABASE_ERROR", message)
 
 
 @app.exception_handler(Exception)
 async def global_exception_handler(request: Request, exc: Exception):
     """전역 예외 처리 (catch-all)"""
     logger.error(
-        f"Unhandled Error: {type(exc).__name__} - {str(exc)}",
+        "Unhandled Error: %s - %s",
+        type(exc).__name__,
+        exc,
         exc_info=True,
     )
     
     if settings.debug:
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=500,
             content={
                 "success": False,
@@ -223,53 +260,70 @@ async def global_exception_handler(request: Request, exc: Exception):
             }
         )
     
-    return JSONResponse(
-        status_code=500,
-        content={
-            "success": False,
-            "error": "INTERNAL_ERROR",
-            "message": get_user_friendly_message("INTERNAL_ERROR"),
-        }
-    )
+    return Response(content=_INTERNAL_ERROR_BODY, status_code=500, media_type="application/json")
 
 
 # 라우터 등록
+# 동적 API(/api/{path:path})는 단일 와일드카드 라우트이고 다른 라우터와 접두사가 겹치지 않으므로
+# 가장 먼저 등록하여 트래픽 대부분을 차지하는 동적 API 호출이 첫 번째 경로 비교에서 매칭되도록 함
+app.include_router(universal_router)
 app.include_router(health_router)
 app.include_router(admin_router)
 app.include_router(schema_router)
-app.include_router(universal_router)  # 가장 마지막에 등록 (catch-all)
 
 
-@app.get("/", tags=["Root"])
-async def root():
+def _index_response(request: Request) -> Response:
+    """캐시된 index.html 응답 (ETag 일치 시 304)"""
+    if request.headers.get("if-none-match") == _INDEX_ETAG:
+        return Response(status_code=304, headers=_INDEX_HEADERS)
+    return Response(content=_INDEX_HTML, media_type="text/html", headers=_INDEX_HEADERS)
+
+
+@app.get("/", tags=["Root"], response_class=Response)
+async def root(request: Request):
     """루트 엔드포인트 - API 테스터 UI로 리디렉트"""
-    return FileResponse(STATIC_DIR / "index.html")
+    return _index_response(request)
 
 
-@app.get("/tester", tags=["Root"])
-async def api_tester():
+@app.get("/tester", tags=["Root"], response_class=Response)
+async def api_tester(request: Request):
     """API 테스터 UI"""
-    return FileResponse(STATIC_DIR / "index.html")
+    return _index_response(request)
+
 
+# 서비스 정보는 시작 후 바뀌지 않으므로 한 번만 직렬화
+_INFO_BODY = orjson.dumps({
+    "service": settings.app_name,
+    "version": "1.0.0",
+    "docs": "/docs",
+    "health": "/health",
+    "tester": "/tester",
+})
 
-@app.get("/info", tags=["Root"])
+
+@app.get("/info", tags=["Root"], response_class=Response)
 async def info():
     """서비스 정보"""
-    return {
-        "service": settings.app_name,
-        "version": "1.0.0",
-        "docs": "/docs",
-        "health": "/health",
-        "tester": "/tester",
-    }
+    return Response(content=_INFO_BODY, media_type="application/json")
+
+
+# 모든 라우트 등록 후 고정 경로 디스패치 테이블 구성
+install_fast_dispatch(app.router)
 
 
 if __name__ == "__main__":
+    import os
+    import sys
     import uvicorn
     uvicorn.run(
         "app.main:app",
         host="0.0.0.0",
         port=8000,
         reload=settings.debug,
+        # uvicorn[standard]의 C 구현 사용 (uvloop은 Windows 미지원)
+        loop="asyncio" if sys.platform == "win32" else "uvloop",
+        http="httptools",
+        # 개발(reload) 모드는 단일 프로세스, 운영은 CPU 코어 수만큼 워커 실행
+        workers=1 if settings.debug else (os.cpu_count() or 1),
     )
 
@@ -6,9 +6,9 @@ API의 기본 정보(경로, 메서드, 활성 상태)를 관리합니다.
 네이밍 규칙: 기존 cliwant DB 패턴 준수
 """
 from datetime import datetime
-from sqlalchemy import Column, String, Text, DateTime, Index, text
-from sqlalchemy.orm import relationship
-from app.core.database import Base
+from sqlalchemy import Column, Computed, Integer, String, Text, DateTime, Index, text
+from sqlalchemy.orm import reconstructor, relationship, validates
+from app.core.database import Base, IdString
 
 
 class ApiRoute(Base):
@@ -21,7 +21,7 @@ class ApiRoute(Base):
     __tablename__ = "APP_API_ROUTE_L"
     
     # Primary Key (기존 패턴: varchar(50))
-    ROUTE_ID = Column(String(50), primary_key=True, comment="라우트 고유 ID")
+    ROUTE_ID = Column(IdString, primary_key=True, comment="라우트 고유 ID")
     
     # API 식별 정보
     API_PATH = Column(String(255), nullable=False, comment="API 경로 (예: user-info, products)")
@@ -33,6 +33,14 @@ class ApiRoute(Base):
     CATEGORY = Column(String(100), nullable=True, comment="API 카테고리")
     TAGS = Column(String(500), nullable=True, comment="태그 (쉼표로 구분)")
     
+    # 첫 번째 태그(카테고리)를 담는 가상 컬럼 - 카테고리 조회/집계를 인덱스로 처리
+    # utf8mb4_bin으로 대소문자가 다른 태그를 별도 카테고리로 유지 (태그가 없으면 NULL)
+    CATEGORY_TAG = Column(
+        String(500, collation="utf8mb4_bin"),
+        Computed("NULLIF(TRIM(SUBSTRING_INDEX(TAGS, ',', 1)), '')", persisted=False),
+        comment="첫 번째 태그 (카테고리 조회용)",
+    )
+    
     # 상태 관리 (기존 패턴: char(1) Y/N)
     USE_YN = Column(String(1), default='Y', nullable=False, comment="사용 여부 (Y/N)")
     DEL_YN = Column(String(1), default='N', nullable=False, comment="삭제 여부 (Y/N)")
@@ -42,6 +50,10 @@ class ApiRoute(Base):
     ALWD_ORGNS = Column(Text, nullable=True, comment="허용된 Origin (CORS)")
     RATE_LMT = Column(String(10), default='100', comment="분당 요청 제한")
     
+    # 현재 버전 번호 (APP_API_VERSION_H의 현재 버전을 비정규화, 버전 생성/현재 버전 변경 시 갱신)
+    # 목록/상세 조회에서 버전 테이블을 조회하지 않고 라우트 행만으로 응답
+    CRNT_VERSION_NO = Column(Integer, nullable=True, comment="현재 버전 번호")
+    
     # 타임스탬프 (기존 패턴: CREA_DT, UPDT_DT)
     CREA_DT = Column(DateTime, default=datetime.utcnow, nullable=False, comment="생성일시")
     UPDT_DT = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False, comment="수정일시")
@@ -52,15 +64,41 @@ class ApiRoute(Base):
     UPDT_BY = Column(String(100), nullable=True, comment="수정자")
     
     # Relationships
-    versions = relationship("ApiVersion", back_populates="route", lazy="dynamic")
+    # 전체 버전 이력은 암묵적으로 로딩하지 않음 (필요 시 select(ApiVersion)으로 명시 조회)
+    versions = relationship("ApiVersion", back_populates="route", lazy="raise")
+    
+    # CATEGORY_TAG는 조회 조건 전용이므로 매핑하지 않음 (ApiRoute.__table__.c로 참조)
+    __mapper_args__ = {"exclude_properties": ["CATEGORY_TAG"]}
     
     # Indexes
     __table_args__ = (
-        Index("IDX_API_ROUTE_PATH_MTHD", "API_PATH", "HTTP_MTHD"),
+        # universal_router 조회(경로+메서드, DEL_YN/USE_YN 필터)를 인덱스만으로 판별
+        Index("IDX_API_ROUTE_LOOKUP", "API_PATH", "HTTP_MTHD", "DEL_YN", "USE_YN"),
+        # 목록 조회 정렬/키셋 페이지네이션 (CREA_DT, ROUTE_ID) 순서
+        Index("IDX_API_ROUTE_CREA_DT", "CREA_DT", "ROUTE_ID"),
+        # 카테고리별 목록/집계 (첫 번째 태그 일치 조회)
+        Index("IDX_API_ROUTE_CATEGORY", "CATEGORY_TAG", "DEL_YN"),
         Index("IDX_API_ROUTE_USE_YN", "USE_YN"),
         Index("IDX_API_ROUTE_DEL_YN", "DEL_YN"),
     )
     
+    # RATE_LMT(문자열)를 정수로 변환한 캐시 (로드/변경 시점에만 계산)
+    _rate_limit_cached = 100
+    
+    @staticmethod
+    def _parse_rate_limit(value) -> int:
+        return int(value) if value else 100
+    
+    @reconstructor
+    def _init_on_load(self):
+        """DB에서 로드된 직후 파생 값 계산"""
+        self._rate_limit_cached = self._parse_rate_limit(self.RATE_LMT)
+    
+    @validates("RATE_LMT")
+    def _on_rate_limit_set(self, key, value):
+        self._rate_limit_cached = self._parse_rate_limit(value)
+        return value
+    
     # Python 속성으로 접근 편의성 제공
     @property
     def id(self):
@@ -108,7 +146,7 @@ class ApiRoute(Base):
     
     @property
     def rate_limit(self):
-        return int(self.RATE_LMT) if self.RATE_LMT else 100
+        return self._rate_limit_cached
     
     @property
     def created_at(self):
@@ -126,5 +164,9 @@ class ApiRoute(Base):
     def created_by(self):
         return self.CREA_BY
     
+    @property
+    def current_version_no(self):
+        return self.CRNT_VERSION_NO
+    
     def __repr__(self):
         return f"<ApiRoute(id={self.ROUTE_ID}, path='{self.API_PATH}', method='{self.HTTP_MTHD}')>"
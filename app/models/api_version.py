@@ -7,9 +7,9 @@ API의 실제 동작 로직을 버전별로 관리합니다.
 네이밍 규칙: 기존 cliwant DB 패턴 준수
 """
 from datetime import datetime
-from sqlalchemy import Column, String, Integer, Text, DateTime, ForeignKey, JSON, Index
+from sqlalchemy import Column, Computed, String, Integer, Text, DateTime, ForeignKey, JSON, Index
 from sqlalchemy.orm import relationship
-from app.core.database import Base
+from app.core.database import Base, IdString
 
 
 class ApiVersion(Base):
@@ -29,10 +29,10 @@ class ApiVersion(Base):
     __tablename__ = "APP_API_VERSION_H"
     
     # Primary Key
-    VERSION_ID = Column(String(50), primary_key=True, comment="버전 고유 ID")
+    VERSION_ID = Column(IdString, primary_key=True, comment="버전 고유 ID")
     
     # Foreign Key
-    ROUTE_ID = Column(String(50), ForeignKey("APP_API_ROUTE_L.ROUTE_ID", ondelete="RESTRICT"), nullable=False)
+    ROUTE_ID = Column(IdString, ForeignKey("APP_API_ROUTE_L.ROUTE_ID", ondelete="RESTRICT"), nullable=False)
     
     # 버전 정보
     VERSION_NO = Column(Integer, nullable=False, comment="버전 번호 (자동 증가)")
@@ -74,13 +74,26 @@ class ApiVersion(Base):
     # 생성자 정보
     CREA_BY = Column(String(100), nullable=True, comment="생성자")
     
+    # 현재 버전(CRNT_YN='Y')일 때만 ROUTE_ID 값을 갖는 가상 컬럼
+    # MySQL은 부분 인덱스를 지원하지 않으므로 이 컬럼의 UNIQUE 인덱스로
+    # 라우트당 현재 버전이 하나뿐임을 DB에서 보장 (NULL은 중복 허용)
+    CRNT_ROUTE_ID = Column(
+        IdString,
+        Computed("CASE WHEN CRNT_YN = 'Y' THEN ROUTE_ID END", persisted=False),
+        comment="현재 버전의 라우트 ID (UK_API_VERSION_CRNT용)",
+    )
+    
     # Relationships
     route = relationship("ApiRoute", back_populates="versions")
     
+    # CRNT_ROUTE_ID는 제약 전용이므로 매핑하지 않음 (조회/flush 후 재조회 없음)
+    __mapper_args__ = {"exclude_properties": ["CRNT_ROUTE_ID"]}
+    
     # Indexes
     __table_args__ = (
         Index("IDX_API_VERSION_ROUTE", "ROUTE_ID", "VERSION_NO"),
         Index("IDX_API_VERSION_CRNT", "ROUTE_ID", "CRNT_YN"),
+        Index("UK_API_VERSION_CRNT", "CRNT_ROUTE_ID", unique=True),
     )
     
     # Python 속성으로 접근 편의성 제공
@@ -8,7 +8,7 @@
 """
 from datetime import datetime
 from sqlalchemy import Column, String, Text, DateTime, JSON, Index
-from app.core.database import Base
+from app.core.database import Base, IdString
 
 
 class AuditLog(Base):
@@ -29,11 +29,11 @@ class AuditLog(Base):
     __tablename__ = "APP_API_AUDIT_H"
     
     # Primary Key
-    AUDIT_ID = Column(String(50), primary_key=True, comment="감사로그 고유 ID")
+    AUDIT_ID = Column(IdString, primary_key=True, comment="감사로그 고유 ID")
     
     # 대상 정보
     TRGT_TYPE = Column(String(50), nullable=False, comment="대상 타입: API_ROUTE, API_VERSION")
-    TRGT_ID = Column(String(50), nullable=False, comment="대상 ID")
+    TRGT_ID = Column(IdString, nullable=False, comment="대상 ID")
     
     # 작업 정보
     ACTION = Column(
@@ -58,7 +58,8 @@ class AuditLog(Base):
     
     # Indexes
     __table_args__ = (
-        Index("IDX_API_AUDIT_TRGT", "TRGT_TYPE", "TRGT_ID"),
+        # 대상별 최신 로그 조회(TRGT_TYPE/TRGT_ID 필터 + CREA_DT 정렬)를 인덱스 순서로 처리
+        Index("IDX_API_AUDIT_TRGT_CREA", "TRGT_TYPE", "TRGT_ID", "CREA_DT"),
         Index("IDX_API_AUDIT_ACTION", "ACTION"),
         Index("IDX_API_AUDIT_CREA_DT", "CREA_DT"),
         Index("IDX_API_AUDIT_ACTOR", "ACTOR"),
@@ -7,16 +7,23 @@ API 정의 관리를 위한 엔드포인트
 - 상태 변경(활성화/비활성화)과 현재 버전 설정만 허용
 - 모든 변경 이력은 감사 로그에 기록됨
 """
-import json
-from typing import Optional, Any
+import asyncio
+import base64
+import hashlib
+import hmac
+import orjson
+import re
+from typing import Annotated, Optional, Any, Union
 from datetime import datetime, timedelta
-from fastapi import APIRouter, Depends, HTTPException, Header, Query, Request
-from fastapi.responses import JSONResponse
-from pydantic import BaseModel, Field
+from fastapi import APIRouter, Depends, HTTPException, Header, Path, Query, Request
+from fastapi.responses import ORJSONResponse, Response, StreamingResponse
+from pydantic import BaseModel, Field, TypeAdapter
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, desc, func, text
+from sqlalchemy import select, desc, func, and_, or_, case, bindparam
+from sqlalchemy.orm import selectinload
 
-from app.core.database import get_db
+from app.core.cache import TTLCache
+from app.core.database import async_session_maker, get_db, run_in_side_session
 from app.core.config import get_settings
 from app.schemas.api_route import (
     ApiRouteCreate,
@@ -28,20 +35,32 @@ from app.schemas.api_version import (
     ApiVersionResponse,
     ApiVersionListResponse,
 )
-from app.schemas.common import ResponseBase, PaginatedResponse
+from app.schemas.common import ID_PATTERN, ResponseBase, PaginatedResponse, CursorPaginatedResponse
 from app.services.api_route_service import ApiRouteService
 from app.services.api_version_service import ApiVersionService
+from app.services.audit_service import AuditService
 from app.models.audit_log import AuditLog
 from app.models.api_route import ApiRoute
 from app.models.api_version import ApiVersion
 
-router = APIRouter(prefix="/admin", tags=["Admin"])
+router = APIRouter(prefix="/admin", tags=["Admin"], default_response_class=ORJSONResponse)
 settings = get_settings()
 
+# 관리자 API 키 (비교용 bytes를 한 번만 인코딩)
+_API_KEY_BYTES = settings.api_key.encode()
+
+# 공개 조회(라우트 목록/상세) 응답 캐시 - 직렬화된 JSON bytes 보관
+# 라우트/버전 변경 시 이 워커에서는 즉시 무효화, 다른 워커는 TTL 경과 후 반영
+_response_cache = TTLCache(ttl=30)
+
+# 경로의 라우트 ID (ASCII가 아닌 값은 DB 조회 전에 검증 오류로 반환)
+RouteId = Annotated[str, Path(pattern=ID_PATTERN, description="API 라우트 ID")]
+_ID_RE = re.compile(ID_PATTERN)
+
 
 async def verify_api_key(x_api_key: str = Header(..., description="관리자 API 키")):
-    """API 키 검증"""
-    if x_api_key != settings.api_key:
+    """API 키 검증 (타이밍 공격 방지를 위해 상수 시간 비교)"""
+    if not hmac.compare_digest(x_api_key.encode(), _API_KEY_BYTES):
         raise HTTPException(
             status_code=401,
             detail={"error": "UNAUTHORIZED", "message": "유효하지 않은 API 키입니다."}
@@ -51,12 +70,62 @@ async def verify_api_key(x_api_key: str = Header(..., description="관리자 API
 
 def get_client_ip(request: Request) -> str:
     """클라이언트 IP 추출"""
-    forwarded = request.headers.get("X-Forwarded-For")
+    forwarded = request.headers.get("x-forwarded-for")
     if forwarded:
-        return forwarded.split(",")[0].strip()
+        # 첫 번째 IP만 필요하므로 리스트를 만들지 않고 첫 쉼표까지만 자름
+        return forwarded.partition(",")[0].strip()
     return request.client.host if request.client else "unknown"
 
 
+def _encode_cursor(crea_dt: datetime, row_id: str) -> str:
+    """목록 커서 생성 (마지막 행의 CREA_DT, ID를 URL-safe base64로 인코딩)"""
+    raw = f"{crea_dt.isoformat()}|{row_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def _decode_cursor(cursor: str) -> tuple[datetime, str]:
+    """목록 커서 해석"""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+        crea_dt, row_id = raw.split("|", 1)
+        if not _ID_RE.match(row_id):
+            raise ValueError(row_id)
+        return datetime.fromisoformat(crea_dt), row_id
+    except ValueError:
+        raise HTTPException(
+            status_code=400,
+            detail={"error": "INVALID_CURSOR", "message": "유효하지 않은 cursor 값입니다."}
+        )
+
+
+def _cached_json(key: tuple) -> Optional[Response]:
+    """캐시된 조회 응답 반환 (없으면 None)"""
+    body = _response_cache.get(key)
+    if body is None:
+        return None
+    return Response(content=body, media_type="application/json")
+
+
+def _cache_body(key: tuple, body: bytes) -> Response:
+    """직렬화된 JSON을 캐시에 저장하고 반환"""
+    _response_cache.set(key, body)
+    return Response(content=body, media_type="application/json")
+
+
+def _cache_json(key: tuple, model: BaseModel) -> Response:
+    """응답 모델을 한 번만 직렬화해 캐시에 저장하고 반환"""
+    return _cache_body(key, model.model_dump_json().encode())
+
+
+def invalidate_route_cache() -> None:
+    """라우트/버전 변경 후 조회 응답 캐시 무효화"""
+    _response_cache.clear()
+
+
+# 버전 목록 응답 검증/직렬화기 (스키마를 한 번만 컴파일하고 목록 전체를 한 번에 처리)
+_VERSION_LIST_RESPONSE = TypeAdapter(ResponseBase[list[ApiVersionListResponse]])
+
+
 # ==================== 상태 변경 스키마 ====================
 
 class StatusChangeRequest(BaseModel):
@@ -69,46 +138,76 @@ class StatusChangeRequest(BaseModel):
 
 @router.get(
     "/routes",
-    response_model=PaginatedResponse[ApiRouteListResponse],
+    response_model=Union[CursorPaginatedResponse[ApiRouteListResponse], PaginatedResponse[ApiRouteListResponse]],
     summary="API 라우트 목록 조회",
-    description="API 키 없이 조회 가능한 공개 엔드포인트입니다.",
+    description=(
+        "API 키 없이 조회 가능한 공개 엔드포인트입니다. "
+        "응답의 next_cursor를 cursor로 전달해 다음 페이지를 조회합니다. "
+        "use_offset=true이면 기존 page 기반 페이지네이션(전체 개수 포함)을 사용합니다."
+    ),
 )
 async def list_routes(
-    page: int = Query(1, ge=1, description="페이지 번호"),
+    cursor: Optional[str] = Query(None, description="다음 페이지 커서 (이전 응답의 next_cursor)"),
     size: int = Query(20, ge=1, le=100, description="페이지 크기"),
     include_inactive: bool = Query(False, description="비활성화된 API 포함"),
+    use_offset: bool = Query(False, description="기존 page 기반(OFFSET) 페이지네이션 사용"),
+    page: int = Query(1, ge=1, description="페이지 번호 (use_offset=true일 때만 사용)"),
     db: AsyncSession = Depends(get_db),
 ):
     """API 라우트 목록을 조회합니다."""
-    routes, total = await ApiRouteService.list_routes(
-        db, page, size, include_inactive, include_deleted=False
-    )
+    cache_key = ("routes", cursor, size, include_inactive, use_offset, page if use_offset else None)
+    cached = _cached_json(cache_key)
+    if cached is not None:
+        return cached
     
-    # 각 라우트의 현재 버전 조회
-    route_list = []
-    for route in routes:
-        current_version = await ApiVersionService.get_current_version(db, route.ROUTE_ID)
-        route_data = ApiRouteListResponse(
-            id=route.ROUTE_ID,
-            path=route.API_PATH,
-            method=route.HTTP_MTHD,
-            name=route.API_NAME,
-            is_active=route.USE_YN == 'Y',
-            require_auth=route.AUTH_YN == 'Y',
-            created_at=route.CREA_DT,
-            current_version=current_version.VERSION_NO if current_version else None,
+    if use_offset:
+        routes, total = await ApiRouteService.list_routes(
+            db, page, size, include_inactive, include_deleted=False
+        )
+    else:
+        routes, has_more = await ApiRouteService.list_routes_after(
+            db,
+            _decode_cursor(cursor) if cursor else None,
+            size,
+            include_inactive,
+            include_deleted=False,
         )
-        route_list.append(route_data)
+    
+    # DB 값은 이미 타입이 정해져 있으므로 Pydantic 검증 없이 dict로 구성해 orjson으로 직렬화
+    # (필드 구성은 ApiRouteListResponse와 동일, 현재 버전 번호는 라우트 행의 CRNT_VERSION_NO)
+    route_list = [
+        {
+            "id": route.ROUTE_ID,
+            "path": route.API_PATH,
+            "method": route.HTTP_MTHD,
+            "name": route.API_NAME,
+            "is_active": route.is_active,
+            "require_auth": route.require_auth,
+            "created_at": route.CREA_DT,
+            "current_version": route.CRNT_VERSION_NO,
+        }
+        for route in routes
+    ]
+    
+    if not use_offset:
+        return _cache_body(cache_key, orjson.dumps({
+            "success": True,
+            "data": route_list,
+            "size": size,
+            "has_more": has_more,
+            "next_cursor": _encode_cursor(routes[-1].CREA_DT, routes[-1].ROUTE_ID) if has_more else None,
+        }))
     
     total_pages = (total + size - 1) // size
     
-    return PaginatedResponse(
-        data=route_list,
-        total=total,
-        page=page,
-        size=size,
-        total_pages=total_pages,
-    )
+    return _cache_body(cache_key, orjson.dumps({
+        "success": True,
+        "data": route_list,
+        "total": total,
+        "page": page,
+        "size": size,
+        "total_pages": total_pages,
+    }))
 
 
 @router.get(
@@ -118,10 +217,16 @@ async def list_routes(
     description="API 키 없이 조회 가능한 공개 엔드포인트입니다.",
 )
 async def get_route(
-    route_id: str,
+    route_id: RouteId,
     db: AsyncSession = Depends(get_db),
 ):
     """특정 API 라우트의 상세 정보를 조회합니다."""
+    cache_key = ("route", route_id)
+    cached = _cached_json(cache_key)
+    if cached is not None:
+        return cached
+    
+    # 현재 버전 번호는 라우트 행(CRNT_VERSION_NO)에 있으므로 라우트만 조회
     route = await ApiRouteService.get_by_id(db, route_id, include_deleted=False)
     
     if not route:
@@ -130,27 +235,9 @@ async def get_route(
             detail={"error": "NOT_FOUND", "message": "API를 찾을 수 없습니다."}
         )
     
-    current_version = await ApiVersionService.get_current_version(db, route.ROUTE_ID)
-    
-    return ResponseBase(
-        data=ApiRouteResponse(
-            id=route.ROUTE_ID,
-            path=route.API_PATH,
-            method=route.HTTP_MTHD,
-            name=route.API_NAME,
-            description=route.API_DESC,
-            tags=route.TAGS,
-            is_active=route.USE_YN == 'Y',
-            is_deleted=route.DEL_YN == 'Y',
-            require_auth=route.AUTH_YN == 'Y',
-            allowed_origins=route.ALWD_ORGNS,
-            rate_limit=int(route.RATE_LMT) if route.RATE_LMT else 100,
-            created_at=route.CREA_DT,
-            updated_at=route.UPDT_DT,
-            created_by=route.CREA_BY,
-            current_version=current_version.VERSION_NO if current_version else None,
-        )
-    )
+    return _cache_json(cache_key, ResponseBase(
+        data=ApiRouteResponse.model_validate(route),
+    ))
 
 
 # ==================== API 라우트 관리 (Immutable: 추가만 가능) ====================
@@ -182,26 +269,11 @@ async def create_route(
             actor="admin",
             actor_ip=get_client_ip(request),
         )
+        invalidate_route_cache()
         
         return ResponseBase(
             message="API 라우트가 생성되었습니다. (Immutable: 수정/삭제 불가)",
-            data=ApiRouteResponse(
-                id=route.ROUTE_ID,
-                path=route.API_PATH,
-                method=route.HTTP_MTHD,
-                name=route.API_NAME,
-                description=route.API_DESC,
-                tags=route.TAGS,
-                is_active=route.USE_YN == 'Y',
-                is_deleted=route.DEL_YN == 'Y',
-                require_auth=route.AUTH_YN == 'Y',
-                allowed_origins=route.ALWD_ORGNS,
-                rate_limit=int(route.RATE_LMT) if route.RATE_LMT else 100,
-                created_at=route.CREA_DT,
-                updated_at=route.UPDT_DT,
-                created_by=route.CREA_BY,
-                current_version=None,
-            )
+            data=ApiRouteResponse.model_validate(route),
         )
     except ValueError as e:
         raise HTTPException(
@@ -217,7 +289,7 @@ async def create_route(
     description="활성화(USE_YN) 상태만 변경합니다. 데이터 자체는 변경되지 않습니다.",
 )
 async def change_route_status(
-    route_id: str,
+    route_id: RouteId,
     data: StatusChangeRequest,
     request: Request,
     db: AsyncSession = Depends(get_db),
@@ -235,44 +307,29 @@ async def change_route_status(
             detail={"error": "NOT_FOUND", "message": "API를 찾을 수 없습니다."}
         )
     
-    # 상태 변경
+    # 상태 변경 + 감사 로그를 하나의 트랜잭션으로 커밋
+    old_use_yn = route.USE_YN
     route.USE_YN = 'Y' if data.is_active else 'N'
-    await db.commit()
-    await db.refresh(route)
     
-    # 감사 로그
     action = "ACTIVATE" if data.is_active else "DEACTIVATE"
-    audit = AuditLog(
-        ROUTE_ID=route_id,
-        ACTION=action,
-        DETAILS={"reason": data.reason} if data.reason else None,
-        ACTOR="admin",
-        ACTOR_IP=get_client_ip(request),
+    await AuditService.log(
+        db=db,
+        target_type="API_ROUTE",
+        target_id=route_id,
+        action=action,
+        old_value={"USE_YN": old_use_yn},
+        new_value={"USE_YN": route.USE_YN},
+        description=data.reason,
+        actor="admin",
+        actor_ip=get_client_ip(request),
     )
-    db.add(audit)
+    # UPDT_DT는 flush 시 Python 기본값으로 채워지므로 refresh 불필요
     await db.commit()
-    
-    current_version = await ApiVersionService.get_current_version(db, route.ROUTE_ID)
+    invalidate_route_cache()
     
     return ResponseBase(
         message=f"API 라우트가 {'활성화' if data.is_active else '비활성화'}되었습니다.",
-        data=ApiRouteResponse(
-            id=route.ROUTE_ID,
-            path=route.API_PATH,
-            method=route.HTTP_MTHD,
-            name=route.API_NAME,
-            description=route.API_DESC,
-            tags=route.TAGS,
-            is_active=route.USE_YN == 'Y',
-            is_deleted=route.DEL_YN == 'Y',
-            require_auth=route.AUTH_YN == 'Y',
-            allowed_origins=route.ALWD_ORGNS,
-            rate_limit=int(route.RATE_LMT) if route.RATE_LMT else 100,
-            created_at=route.CREA_DT,
-            updated_at=route.UPDT_DT,
-            created_by=route.CREA_BY,
-            current_version=current_version.VERSION_NO if current_version else None,
-        )
+        data=ApiRouteResponse.model_validate(route),
     )
 
 
@@ -285,34 +342,24 @@ async def change_route_status(
     description="API 키 없이 조회 가능한 공개 엔드포인트입니다.",
 )
 async def list_versions(
-    route_id: str,
+    route_id: RouteId,
     db: AsyncSession = Depends(get_db),
 ):
     """특정 API 라우트의 모든 버전을 조회합니다."""
-    route = await ApiRouteService.get_by_id(db, route_id, include_deleted=False)
-    if not route:
+    # 라우트 존재 확인과 버전 목록 조회를 동시에 실행
+    route_exists, versions = await asyncio.gather(
+        ApiRouteService.exists(db, route_id),
+        run_in_side_session(ApiVersionService.list_versions, route_id),
+    )
+    if not route_exists:
         raise HTTPException(
             status_code=404,
             detail={"error": "NOT_FOUND", "message": "API를 찾을 수 없습니다."}
         )
     
-    versions = await ApiVersionService.list_versions(db, route_id)
-    
-    return ResponseBase(
-        data=[
-            ApiVersionListResponse(
-                id=v.VERSION_ID,
-                route_id=v.ROUTE_ID,
-                version=v.VERSION_NO,
-                is_current=v.CRNT_YN == 'Y',
-                logic_type=v.LOGIC_TYPE,
-                change_note=v.CHG_NOTE,
-                created_at=v.CREA_DT,
-                created_by=v.CREA_BY,
-            )
-            for v in versions
-        ]
-    )
+    # ORM 객체 목록을 한 번에 검증하고 바로 JSON bytes로 직렬화 (응답 모델 재검증 생략)
+    response = _VERSION_LIST_RESPONSE.validate_python({"data": versions}, from_attributes=True)
+    return Response(content=_VERSION_LIST_RESPONSE.dump_json(response), media_type="application/json")
 
 
 @router.get(
@@ -322,7 +369,7 @@ async def list_versions(
     description="API 키 없이 조회 가능한 공개 엔드포인트입니다.",
 )
 async def get_version(
-    route_id: str,
+    route_id: RouteId,
     version_number: int,
     db: AsyncSession = Depends(get_db),
 ):
@@ -336,22 +383,7 @@ async def get_version(
         )
     
     return ResponseBase(
-        data=ApiVersionResponse(
-            id=version.VERSION_ID,
-            route_id=version.ROUTE_ID,
-            version=version.VERSION_NO,
-            is_current=version.CRNT_YN == 'Y',
-            request_spec=version.REQ_SPEC,
-            logic_type=version.LOGIC_TYPE,
-            logic_body=version.LOGIC_BODY,
-            logic_config=version.LOGIC_CFG,
-            response_spec=version.RESP_SPEC,
-            status_codes=version.STATUS_CDS,
-            change_note=version.CHG_NOTE,
-            sample_params=version.SMPL_PARAMS,
-            created_at=version.CREA_DT,
-            created_by=version.CREA_BY,
-        )
+        data=ApiVersionResponse.model_validate(version),
     )
 
 
@@ -362,7 +394,7 @@ async def get_version(
     description="🔒 Immutable: 기존 버전은 수정되지 않고 새 버전이 추가됩니다.",
 )
 async def create_version(
-    route_id: str,
+    route_id: RouteId,
     data: ApiVersionCreate,
     request: Request,
     db: AsyncSession = Depends(get_db),
@@ -376,9 +408,8 @@ async def create_version(
     - 새 버전이 자동으로 현재 버전이 됨
     - 버전 번호는 자동 증가 (정수)
     """
-    # route_id 확인
-    route = await ApiRouteService.get_by_id(db, route_id, include_deleted=False)
-    if not route:
+    # route_id 확인 (존재 여부만 필요하므로 라우트 행은 읽지 않음)
+    if not await ApiRouteService.exists(db, route_id):
         raise HTTPException(
             status_code=404,
             detail={"error": "NOT_FOUND", "message": "API를 찾을 수 없습니다."}
@@ -394,25 +425,11 @@ async def create_version(
             actor="admin",
             actor_ip=get_client_ip(request),
         )
+        invalidate_route_cache()
         
         return ResponseBase(
             message=f"버전 {version.VERSION_NO}이 생성되었습니다. (Immutable: 수정/삭제 불가)",
-            data=ApiVersionResponse(
-                id=version.VERSION_ID,
-                route_id=version.ROUTE_ID,
-                version=version.VERSION_NO,
-                is_current=version.CRNT_YN == 'Y',
-                request_spec=version.REQ_SPEC,
-                logic_type=version.LOGIC_TYPE,
-                logic_body=version.LOGIC_BODY,
-                logic_config=version.LOGIC_CFG,
-                response_spec=version.RESP_SPEC,
-                status_codes=version.STATUS_CDS,
-                change_note=version.CHG_NOTE,
-                sample_params=version.SMPL_PARAMS,
-                created_at=version.CREA_DT,
-                created_by=version.CREA_BY,
-            )
+            data=ApiVersionResponse.model_validate(version),
         )
     except ValueError as e:
         raise HTTPException(
@@ -428,7 +445,7 @@ async def create_version(
     description="특정 버전을 현재 활성 버전으로 설정합니다. (기존 버전은 보존됨)",
 )
 async def activate_version(
-    route_id: str,
+    route_id: RouteId,
     version_number: int,
     request: Request,
     db: AsyncSession = Depends(get_db),
@@ -452,25 +469,11 @@ async def activate_version(
             status_code=404,
             detail={"error": "NOT_FOUND", "message": "버전을 찾을 수 없습니다."}
         )
+    invalidate_route_cache()
     
     return ResponseBase(
         message=f"버전 {version_number}이 현재 버전으로 설정되었습니다.",
-        data=ApiVersionResponse(
-            id=version.VERSION_ID,
-            route_id=version.ROUTE_ID,
-            version=version.VERSION_NO,
-            is_current=version.CRNT_YN == 'Y',
-            request_spec=version.REQ_SPEC,
-            logic_type=version.LOGIC_TYPE,
-            logic_body=version.LOGIC_BODY,
-            logic_config=version.LOGIC_CFG,
-            response_spec=version.RESP_SPEC,
-            status_codes=version.STATUS_CDS,
-            change_note=version.CHG_NOTE,
-            sample_params=version.SMPL_PARAMS,
-            created_at=version.CREA_DT,
-            created_by=version.CREA_BY,
-        )
+        data=ApiVersionResponse.model_validate(version),
     )
 
 
@@ -482,47 +485,109 @@ async def activate_version(
     description="특정 API의 변경 이력을 조회합니다. API 키 없이 조회 가능합니다.",
 )
 async def get_audit_logs(
-    route_id: str,
+    route_id: RouteId,
     limit: int = Query(20, ge=1, le=100, description="조회 개수"),
+    before: Optional[str] = Query(None, description="다음 페이지 커서 (이전 응답의 next_cursor)"),
     db: AsyncSession = Depends(get_db),
 ):
     """특정 API 라우트의 감사 로그를 조회합니다."""
-    # 라우트 존재 여부 확인
-    route = await ApiRouteService.get_by_id(db, route_id, include_deleted=False)
-    if not route:
-        raise HTTPException(
-            status_code=404,
-            detail={"error": "NOT_FOUND", "message": "API를 찾을 수 없습니다."}
-        )
-    
-    # 감사 로그 조회
-    result = await db.execute(
+    # 라우트 자체 로그 + 해당 라우트 버전들의 로그
+    logs_query = (
         select(AuditLog)
-        .where(AuditLog.ROUTE_ID == route_id)
-        .order_by(desc(AuditLog.CREA_DT))
+        .where(
+            or_(
+                and_(AuditLog.TRGT_TYPE == "API_ROUTE", AuditLog.TRGT_ID == route_id),
+                and_(
+                    AuditLog.TRGT_TYPE == "API_VERSION",
+                    AuditLog.TRGT_ID.in_(
+                        select(ApiVersion.VERSION_ID).where(ApiVersion.ROUTE_ID == route_id)
+                    ),
+                ),
+            )
+        )
+        .order_by(desc(AuditLog.CREA_DT), desc(AuditLog.AUDIT_ID))
         .limit(limit)
     )
+    
+    if before:
+        # 키셋 페이지네이션: 이전 페이지 마지막 행 (CREA_DT, AUDIT_ID) 다음부터
+        # (CREA_DT는 초 단위라 같은 시각의 로그가 많으므로 AUDIT_ID로 순서를 고정)
+        crea_dt, audit_id = _decode_cursor(before)
+        logs_query = logs_query.where(
+            or_(
+                AuditLog.CREA_DT < crea_dt,
+                and_(AuditLog.CREA_DT == crea_dt, AuditLog.AUDIT_ID < audit_id),
+            )
+        )
+    
+    # 별도의 라우트 존재 확인 없이 로그만 조회 (없는 라우트는 빈 목록)
+    # 결과는 limit(최대 100건)으로 제한되므로 한 번에 조회하여 응답
+    result = await db.execute(logs_query)
     logs = result.scalars().all()
     
-    return ResponseBase(
-        data=[
+    # limit만큼 채워졌으면 다음 페이지가 있을 수 있으므로 마지막 행 기준 커서 전달
+    next_cursor = _encode_cursor(logs[-1].CREA_DT, logs[-1].AUDIT_ID) if len(logs) == limit else None
+    
+    return ORJSONResponse({
+        "success": True,
+        "message": None,
+        "data": [
             {
                 "id": log.AUDIT_ID,
-                "route_id": log.ROUTE_ID,
-                "version_id": log.VERSION_ID,
+                "route_id": route_id,
+                "version_id": log.TRGT_ID if log.TRGT_TYPE == "API_VERSION" else None,
                 "action": log.ACTION,
-                "details": log.DETAILS,
+                "details": log.DESC,
                 "actor": log.ACTOR,
                 "actor_ip": log.ACTOR_IP,
-                "created_at": log.CREA_DT.isoformat() if log.CREA_DT else None,
+                "created_at": log.CREA_DT,
             }
             for log in logs
-        ]
-    )
+        ],
+        "next_cursor": next_cursor,
+    })
 
 
 # ==================== Immutable 정책 안내 ====================
 
+# 정책 안내는 고정 내용이므로 import 시점에 JSON bytes로 한 번만 직렬화
+_POLICY_BODY = orjson.dumps({
+    "success": True,
+    "message": None,
+    "data": {
+        "policy": "IMMUTABLE",
+        "description": "API 정의 데이터는 추가만 가능하며 수정/삭제할 수 없습니다.",
+        "rules": [
+            {
+                "resource": "APP_API_ROUTE_L",
+                "allowed": ["CREATE", "ACTIVATE", "DEACTIVATE"],
+                "forbidden": ["UPDATE", "DELETE"],
+                "note": "라우트 생성 후 USE_YN 상태만 변경 가능",
+            },
+            {
+                "resource": "APP_API_VERSION_H",
+                "allowed": ["CREATE", "SET_CURRENT"],
+                "forbidden": ["UPDATE", "DELETE"],
+                "note": "버전 생성 후 CRNT_YN 플래그만 변경 가능",
+            },
+            {
+                "resource": "APP_API_AUDIT_H",
+                "allowed": ["CREATE"],
+                "forbidden": ["UPDATE", "DELETE"],
+                "note": "감사 로그는 자동 생성되며 변경 불가",
+            },
+        ],
+        "version_numbering": "정수 자동 증가 (1, 2, 3, ...)",
+        "benefits": [
+            "실수로 인한 API 삭제 방지",
+            "모든 변경 이력 보존",
+            "언제든 이전 버전으로 복원 가능",
+            "감사 추적 용이",
+        ],
+    },
+})
+
+
 @router.get(
     "/policy",
     summary="API 관리 정책 조회",
@@ -530,43 +595,14 @@ async def get_audit_logs(
 )
 async def get_policy():
     """API 관리 정책을 반환합니다."""
-    return ResponseBase(
-        data={
-            "policy": "IMMUTABLE",
-            "description": "API 정의 데이터는 추가만 가능하며 수정/삭제할 수 없습니다.",
-            "rules": [
-                {
-                    "resource": "APP_API_ROUTE_L",
-                    "allowed": ["CREATE", "ACTIVATE", "DEACTIVATE"],
-                    "forbidden": ["UPDATE", "DELETE"],
-                    "note": "라우트 생성 후 USE_YN 상태만 변경 가능",
-                },
-                {
-                    "resource": "APP_API_VERSION_H",
-                    "allowed": ["CREATE", "SET_CURRENT"],
-                    "forbidden": ["UPDATE", "DELETE"],
-                    "note": "버전 생성 후 CRNT_YN 플래그만 변경 가능",
-                },
-                {
-                    "resource": "APP_API_AUDIT_H",
-                    "allowed": ["CREATE"],
-                    "forbidden": ["UPDATE", "DELETE"],
-                    "note": "감사 로그는 자동 생성되며 변경 불가",
-                },
-            ],
-            "version_numbering": "정수 자동 증가 (1, 2, 3, ...)",
-            "benefits": [
-                "실수로 인한 API 삭제 방지",
-                "모든 변경 이력 보존",
-                "언제든 이전 버전으로 복원 가능",
-                "감사 추적 용이",
-            ],
-        }
-    )
+    return Response(content=_POLICY_BODY, media_type="application/json")
 
 
 # ==================== API 카테고리/그룹 관리 ====================
 
+# 첫 번째 태그 가상 컬럼 (ORM 매핑에서 제외되어 테이블 컬럼으로 참조)
+_CATEGORY_TAG = ApiRoute.__table__.c.CATEGORY_TAG
+
 @router.get(
     "/categories",
     summary="API 카테고리 목록 조회",
@@ -577,34 +613,22 @@ async def list_categories(
 ):
     """API 카테고리 목록을 조회합니다."""
     # 태그 기반 카테고리 추출 (태그의 첫 번째 부분을 카테고리로 사용)
+    # 카테고리별 집계를 DB에서 한 번에 수행 (태그가 없으면 CATEGORY_TAG = NULL)
     result = await db.execute(
-        select(ApiRoute.TAGS)
+        select(_CATEGORY_TAG, func.count().label("cnt"))
         .where(ApiRoute.DEL_YN == 'N')
-        .where(ApiRoute.TAGS.isnot(None))
+        .group_by(_CATEGORY_TAG)
     )
-    tags_list = result.scalars().all()
     
-    # 카테고리별 API 수 집계
     categories = {}
-    for tags in tags_list:
-        if tags:
-            primary_tag = tags.split(',')[0].strip()
-            categories[primary_tag] = categories.get(primary_tag, 0) + 1
-    
-    # 전체 API 수
-    total_result = await db.execute(
-        select(func.count(ApiRoute.ROUTE_ID))
-        .where(ApiRoute.DEL_YN == 'N')
-    )
-    total_count = total_result.scalar() or 0
-    
-    # 카테고리 없는 API 수
-    uncategorized_result = await db.execute(
-        select(func.count(ApiRoute.ROUTE_ID))
-        .where(ApiRoute.DEL_YN == 'N')
-        .where(ApiRoute.TAGS.is_(None) | (ApiRoute.TAGS == ''))
-    )
-    uncategorized_count = uncategorized_result.scalar() or 0
+    total_count = 0
+    uncategorized_count = 0
+    for name, count in result.all():
+        total_count += count
+        if name is None:
+            uncategorized_count = count
+        else:
+            categories[name] = count
     
     return ResponseBase(
         data={
@@ -628,25 +652,26 @@ async def list_apis_by_category(
     db: AsyncSession = Depends(get_db),
 ):
     """특정 카테고리의 API 목록을 조회합니다."""
+    # 첫 번째 태그가 정확히 일치하는 라우트만 조회 (IDX_API_ROUTE_CATEGORY 사용)
     result = await db.execute(
         select(ApiRoute)
+        .where(_CATEGORY_TAG == category_name)
         .where(ApiRoute.DEL_YN == 'N')
-        .where(ApiRoute.TAGS.like(f"{category_name}%"))
     )
     routes = result.scalars().all()
     
-    api_list = []
-    for route in routes:
-        current_version = await ApiVersionService.get_current_version(db, route.ROUTE_ID)
-        api_list.append({
+    api_list = [
+        {
             "id": route.ROUTE_ID,
             "path": route.API_PATH,
             "method": route.HTTP_MTHD,
             "name": route.API_NAME,
             "tags": route.TAGS,
-            "is_active": route.USE_YN == 'Y',
-            "current_version": current_version.VERSION_NO if current_version else None,
-        })
+            "is_active": route.is_active,
+            "current_version": route.CRNT_VERSION_NO,
+        }
+        for route in routes
+    ]
     
     return ResponseBase(
         data={
@@ -659,132 +684,198 @@ async def list_apis_by_category(
 
 # ==================== API 문서 자동 생성 (OpenAPI) ====================
 
+# 마지막으로 생성한 OpenAPI 스펙 (key: 라우트/버전 변경 여부 판별용 집계 값)
+_openapi_cache: dict[str, Any] = {"key": None, "body": None, "etag": None}
+
+
+# 스펙 생성 시 한 번에 처리할 라우트 수
+_OPENAPI_CHUNK_SIZE = 200
+
+# 스펙의 고정 부분 (요청마다 같은 dict를 다시 만들지 않고 공유)
+_OPENAPI_HEADER: dict[str, Any] = {
+    "openapi": "3.0.3",
+    "info": {
+        "title": "Dynamic API Engine",
+        "description": "MySQL 테이블 기반 동적 API 엔진 - 자동 생성된 API 문서",
+        "version": "1.7.0",
+        "contact": {
+            "name": "API Support",
+        },
+    },
+    "servers": [
+        {
+            "url": "http://localhost:8000",
+            "description": "Local Development Server",
+        }
+    ],
+}
+
+# 모든 동적 API operation에 공통으로 쓰는 응답 정의
+_OPENAPI_RESPONSES: dict[str, Any] = {
+    "200": {
+        "description": "성공",
+        "content": {
+            "application/json": {
+                "schema": {"type": "object"}
+            }
+        }
+    },
+    "400": {"description": "잘못된 요청"},
+    "500": {"description": "서버 오류"},
+}
+
+
+def _parse_req_spec(req_spec: Any) -> Optional[dict[str, dict]]:
+    """
+    REQ_SPEC 파싱 및 형식 검증 ({파라미터명: {type, required, ...}} 형태)
+
+    형식이 맞지 않는 스펙은 None을 반환하여 문서 생성에서 제외합니다.
+    """
+    if isinstance(req_spec, (str, bytes)):
+        try:
+            req_spec = orjson.loads(req_spec)
+        except orjson.JSONDecodeError:
+            return None
+    if not isinstance(req_spec, dict):
+        return None
+    if not all(isinstance(param_info, dict) for param_info in req_spec.values()):
+        return None
+    return req_spec
+
+
+async def _openapi_fingerprint(db: AsyncSession) -> tuple:
+    """스펙 재생성 필요 여부를 판별하는 집계 값 (라우트 수정/추가, 버전 추가/현재 버전 변경 반영)"""
+    active_routes = and_(ApiRoute.DEL_YN == 'N', ApiRoute.USE_YN == 'Y')
+    result = await db.execute(
+        select(
+            select(func.max(ApiRoute.UPDT_DT)).where(active_routes).scalar_subquery(),
+            select(func.count()).select_from(ApiRoute).where(active_routes).scalar_subquery(),
+            select(func.max(ApiVersion.CREA_DT)).scalar_subquery(),
+            select(func.coalesce(func.sum(ApiVersion.VERSION_NO), 0))
+            .where(ApiVersion.CRNT_YN == 'Y')
+            .scalar_subquery(),
+        )
+    )
+    return tuple(result.one())
+
+
 @router.get(
     "/openapi-spec",
     summary="동적 OpenAPI 스펙 생성",
     description="등록된 모든 API에 대한 OpenAPI 3.0 스펙을 자동 생성합니다.",
 )
 async def generate_openapi_spec(
+    request: Request,
     db: AsyncSession = Depends(get_db),
 ):
     """동적 API에 대한 OpenAPI 스펙을 생성합니다."""
-    # 활성화된 모든 라우트 조회
-    result = await db.execute(
-        select(ApiRoute)
-        .where(ApiRoute.DEL_YN == 'N')
-        .where(ApiRoute.USE_YN == 'Y')
-    )
-    routes = result.scalars().all()
+    # 라우트/버전이 바뀌지 않았으면 이전에 생성한 스펙 재사용 (ETag 일치 시 304)
+    key = await _openapi_fingerprint(db)
+    if key == _openapi_cache["key"]:
+        headers = {"ETag": _openapi_cache["etag"]}
+        if request.headers.get("if-none-match") == _openapi_cache["etag"]:
+            return Response(status_code=304, headers=headers)
+        return Response(content=_openapi_cache["body"], media_type="application/json", headers=headers)
     
     paths = {}
     tags_set = set()
     
-    for route in routes:
-        current_version = await ApiVersionService.get_current_version(db, route.ROUTE_ID)
-        if not current_version:
-            continue
-        
-        path = f"/api/{route.API_PATH}"
-        method = route.HTTP_MTHD.lower()
-        
-        # 태그 추출
-        api_tags = [route.TAGS.split(',')[0].strip()] if route.TAGS else ["default"]
-        tags_set.update(api_tags)
-        
-        # 파라미터 정의
-        parameters = []
-        request_body = None
-        
-        if current_version.REQ_SPEC:
-            req_spec = current_version.REQ_SPEC
-            if isinstance(req_spec, str):
-                req_spec = json.loads(req_spec)
+    # 활성화된 라우트를 묶음 단위로 읽으며 묶음마다 현재 버전을 한 번에 조회
+    # (라우트는 서버 사이드 커서로 읽는 중이므로 버전 조회는 요청 세션에서 실행)
+    async with async_session_maker() as route_session:
+        routes = await route_session.stream_scalars(
+            select(ApiRoute)
+            .where(ApiRoute.DEL_YN == 'N')
+            .where(ApiRoute.USE_YN == 'Y')
+            .execution_options(yield_per=_OPENAPI_CHUNK_SIZE)
+        )
+        async for chunk in routes.partitions():
+            current_versions = await ApiVersionService.get_current_versions_bulk(
+                db, [route.ROUTE_ID for route in chunk]
+            )
             
-            for param_name, param_info in req_spec.items():
-                if method in ['get', 'delete']:
-                    parameters.append({
-                        "name": param_name,
-                        "in": "query",
-                        "required": param_info.get("required", False),
-                        "schema": {
-                            "type": param_info.get("type", "string"),
-                            "default": param_info.get("default"),
-                        },
-                        "description": param_info.get("description", ""),
-                    })
-                else:
-                    if not request_body:
-                        request_body = {
-                            "content": {
-                                "application/json": {
-                                    "schema": {
-                                        "type": "object",
-                                        "properties": {},
-                                        "required": [],
+            for route in chunk:
+                current_version = current_versions.get(route.ROUTE_ID)
+                if not current_version:
+                    continue
+                
+                path = f"/api/{route.API_PATH}"
+                method = route.HTTP_MTHD.lower()
+                
+                # 태그 추출
+                api_tags = [route.TAGS.partition(',')[0].strip()] if route.TAGS else ["default"]
+                tags_set.update(api_tags)
+                
+                # 파라미터 정의
+                parameters = []
+                request_body = None
+                
+                req_spec = _parse_req_spec(current_version.REQ_SPEC) if current_version.REQ_SPEC else None
+                if req_spec:
+                    for param_name, param_info in req_spec.items():
+                        if method in ['get', 'delete']:
+                            parameters.append({
+                                "name": param_name,
+                                "in": "query",
+                                "required": param_info.get("required", False),
+                                "schema": {
+                                    "type": param_info.get("type", "string"),
+                                    "default": param_info.get("default"),
+                                },
+                                "description": param_info.get("description", ""),
+                            })
+                        else:
+                            if not request_body:
+                                request_body = {
+                                    "content": {
+                                        "application/json": {
+                                            "schema": {
+                                                "type": "object",
+                                                "properties": {},
+                                                "required": [],
+                                            }
+                                        }
                                     }
                                 }
+                            props = request_body["content"]["application/json"]["schema"]["properties"]
+                            props[param_name] = {
+                                "type": param_info.get("type", "string"),
+                                "description": param_info.get("description", ""),
                             }
-                        }
-                    props = request_body["content"]["application/json"]["schema"]["properties"]
-                    props[param_name] = {
-                        "type": param_info.get("type", "string"),
-                        "description": param_info.get("description", ""),
-                    }
-                    if param_info.get("required"):
-                        request_body["content"]["application/json"]["schema"]["required"].append(param_name)
-        
-        # 경로 엔트리 생성
-        if path not in paths:
-            paths[path] = {}
-        
-        operation = {
-            "tags": api_tags,
-            "summary": route.API_NAME or route.API_PATH,
-            "description": route.API_DESC or "",
-            "operationId": f"{method}_{route.ROUTE_ID}",
-            "responses": {
-                "200": {
-                    "description": "성공",
-                    "content": {
-                        "application/json": {
-                            "schema": {"type": "object"}
-                        }
-                    }
-                },
-                "400": {"description": "잘못된 요청"},
-                "500": {"description": "서버 오류"},
-            },
-        }
-        
-        if parameters:
-            operation["parameters"] = parameters
-        if request_body:
-            operation["requestBody"] = request_body
-        
-        paths[path][method] = operation
+                            if param_info.get("required"):
+                                request_body["content"]["application/json"]["schema"]["required"].append(param_name)
+                
+                # 경로 엔트리 생성
+                if path not in paths:
+                    paths[path] = {}
+                
+                operation = {
+                    "tags": api_tags,
+                    "summary": route.API_NAME or route.API_PATH,
+                    "description": route.API_DESC or "",
+                    "operationId": f"{method}_{route.ROUTE_ID}",
+                    "responses": _OPENAPI_RESPONSES,
+                }
+                
+                if parameters:
+                    operation["parameters"] = parameters
+                if request_body:
+                    operation["requestBody"] = request_body
+                
+                paths[path][method] = operation
     
     # OpenAPI 스펙 조립
     openapi_spec = {
-        "openapi": "3.0.3",
-        "info": {
-            "title": "Dynamic API Engine",
-            "description": "MySQL 테이블 기반 동적 API 엔진 - 자동 생성된 API 문서",
-            "version": "1.7.0",
-            "contact": {
-                "name": "API Support",
-            },
-        },
-        "servers": [
-            {
-                "url": "http://localhost:8000",
-                "description": "Local Development Server",
-            }
-        ],
+        **_OPENAPI_HEADER,
         "tags": [{"name": tag, "description": f"{tag} 관련 API"} for tag in sorted(tags_set)],
         "paths": paths,
     }
     
-    return JSONResponse(content=openapi_spec)
+    body = orjson.dumps(openapi_spec)
+    etag = f'"{hashlib.blake2b(body, digest_size=8).hexdigest()}"'
+    _openapi_cache.update(key=key, body=body, etag=etag)
+    
+    return Response(content=body, media_type="application/json", headers={"ETag": etag})
 
 
 @router.get(
@@ -793,7 +884,7 @@ async def generate_openapi_spec(
     description="특정 API의 OpenAPI 스펙을 반환합니다.",
 )
 async def get_route_openapi(
-    route_id: str,
+    route_id: RouteId,
     db: AsyncSession = Depends(get_db),
 ):
     """특정 API의 OpenAPI 스펙을 반환합니다."""
@@ -830,56 +921,41 @@ async def get_stats_overview(
     db: AsyncSession = Depends(get_db),
 ):
     """API 통계 개요를 반환합니다."""
-    # 총 API 수
-    total_result = await db.execute(
-        select(func.count(ApiRoute.ROUTE_ID))
-        .where(ApiRoute.DEL_YN == 'N')
-    )
-    total_count = total_result.scalar() or 0
-    
-    # 활성화된 API 수
-    active_result = await db.execute(
-        select(func.count(ApiRoute.ROUTE_ID))
-        .where(ApiRoute.DEL_YN == 'N')
-        .where(ApiRoute.USE_YN == 'Y')
-    )
-    active_count = active_result.scalar() or 0
-    
-    # HTTP 메서드별 API 수
-    method_result = await db.execute(
-        select(ApiRoute.HTTP_MTHD, func.count(ApiRoute.ROUTE_ID))
-        .where(ApiRoute.DEL_YN == 'N')
-        .group_by(ApiRoute.HTTP_MTHD)
-    )
-    methods = {row[0]: row[1] for row in method_result.fetchall()}
-    
-    # 로직 타입별 API 수
-    logic_result = await db.execute(
-        select(ApiVersion.LOGIC_TYPE, func.count(ApiVersion.VERSION_ID))
-        .where(ApiVersion.CRNT_YN == 'Y')
-        .group_by(ApiVersion.LOGIC_TYPE)
-    )
-    logic_types = {row[0]: row[1] for row in logic_result.fetchall()}
-    
-    # 최근 생성된 API (7일)
+    # 라우트 통계: 메서드별로 전체/활성/최근 7일 생성 수를 한 번에 집계
     week_ago = datetime.utcnow() - timedelta(days=7)
-    recent_result = await db.execute(
-        select(func.count(ApiRoute.ROUTE_ID))
+    route_result = await db.execute(
+        select(
+            ApiRoute.HTTP_MTHD,
+            func.count(),
+            func.sum(case((ApiRoute.USE_YN == 'Y', 1), else_=0)),
+            func.sum(case((ApiRoute.CREA_DT >= week_ago, 1), else_=0)),
+        )
         .where(ApiRoute.DEL_YN == 'N')
-        .where(ApiRoute.CREA_DT >= week_ago)
+        .group_by(ApiRoute.HTTP_MTHD)
     )
-    recent_count = recent_result.scalar() or 0
+    methods = {}
+    total_count = active_count = recent_count = 0
+    for method, count, active, recent in route_result.all():
+        methods[method] = count
+        total_count += count
+        active_count += int(active or 0)
+        recent_count += int(recent or 0)
     
-    # 버전 통계
+    # 버전 통계: 로직 타입별로 전체/현재 버전 수를 한 번에 집계
     version_result = await db.execute(
-        select(func.count(ApiVersion.VERSION_ID))
-    )
-    total_versions = version_result.scalar() or 0
-    
-    avg_version_result = await db.execute(
-        select(func.avg(func.count(ApiVersion.VERSION_ID)))
-        .group_by(ApiVersion.ROUTE_ID)
+        select(
+            ApiVersion.LOGIC_TYPE,
+            func.count(),
+            func.sum(case((ApiVersion.CRNT_YN == 'Y', 1), else_=0)),
+        )
+        .group_by(ApiVersion.LOGIC_TYPE)
     )
+    logic_types = {}
+    total_versions = 0
+    for logic_type, count, current in version_result.all():
+        total_versions += count
+        if current:
+            logic_types[logic_type] = int(current)
     
     return ResponseBase(
         data={
@@ -894,6 +970,16 @@ async def get_stats_overview(
     )
 
 
+# 일자×액션별 감사 로그 집계 (구문을 한 번만 구성하고 시작일만 바인딩)
+# GROUP BY에만 DATE()를 쓰고 WHERE는 CREA_DT 범위 조건으로 두어 IDX_API_AUDIT_CREA_DT 사용
+_AUDIT_DAY = func.date(AuditLog.CREA_DT)
+_AUDIT_SUMMARY_QUERY = (
+    select(_AUDIT_DAY, AuditLog.ACTION, func.count())
+    .where(AuditLog.CREA_DT >= bindparam("start_date"))
+    .group_by(_AUDIT_DAY, AuditLog.ACTION)
+)
+
+
 @router.get(
     "/stats/audit-summary",
     summary="감사 로그 요약",
@@ -906,26 +992,17 @@ async def get_audit_summary(
     """감사 로그 요약을 반환합니다."""
     start_date = datetime.utcnow() - timedelta(days=days)
     
-    # 액션별 집계
-    action_result = await db.execute(
-        select(AuditLog.ACTION, func.count(AuditLog.AUDIT_ID))
-        .where(AuditLog.CREA_DT >= start_date)
-        .group_by(AuditLog.ACTION)
-    )
-    actions = {row[0]: row[1] for row in action_result.fetchall()}
-    
-    # 일별 활동 집계
-    daily_result = await db.execute(
-        text("""
-            SELECT DATE(CREA_DT) as date, COUNT(*) as count
-            FROM APP_API_AUDIT_H
-            WHERE CREA_DT >= :start_date
-            GROUP BY DATE(CREA_DT)
-            ORDER BY date DESC
-        """),
-        {"start_date": start_date}
-    )
-    daily_activity = [{"date": str(row[0]), "count": row[1]} for row in daily_result.fetchall()]
+    # 일자×액션별 집계 한 번으로 액션별/일별 통계를 함께 계산 (감사 로그 테이블 1회 스캔)
+    summary_result = await db.execute(_AUDIT_SUMMARY_QUERY, {"start_date": start_date})
+    actions: dict[str, int] = {}
+    daily_counts: dict[Any, int] = {}
+    for date, action, count in summary_result.all():
+        actions[action] = actions.get(action, 0) + count
+        daily_counts[date] = daily_counts.get(date, 0) + count
+    daily_activity = [
+        {"date": date, "count": count}
+        for date, count in sorted(daily_counts.items(), reverse=True)
+    ]
     
     # 최근 활동
     recent_result = await db.execute(
@@ -935,8 +1012,11 @@ async def get_audit_summary(
     )
     recent_logs = recent_result.scalars().all()
     
-    return ResponseBase(
-        data={
+    # date/datetime 값은 orjson이 직접 직렬화하도록 그대로 전달 (jsonable_encoder 변환 생략)
+    return ORJSONResponse({
+        "success": True,
+        "message": None,
+        "data": {
             "period_days": days,
             "by_action": actions,
             "daily_activity": daily_activity,
@@ -944,14 +1024,15 @@ async def get_audit_summary(
                 {
                     "id": log.AUDIT_ID,
                     "action": log.ACTION,
-                    "route_id": log.ROUTE_ID,
+                    "route_id": log.TRGT_ID if log.TRGT_TYPE == "API_ROUTE" else None,
+                    "version_id": log.TRGT_ID if log.TRGT_TYPE == "API_VERSION" else None,
                     "actor": log.ACTOR,
-                    "created_at": log.CREA_DT.isoformat() if log.CREA_DT else None,
+                    "created_at": log.CREA_DT,
                 }
                 for log in recent_logs
             ],
-        }
-    )
+        },
+    })
 
 
 # ==================== API Import/Export ====================
@@ -962,78 +1043,124 @@ class ImportRequest(BaseModel):
     overwrite: bool = Field(False, description="기존 API 덮어쓰기 여부")
 
 
+# 전체 내보내기 시 한 번에 처리할 라우트 수 (버전은 묶음마다 한 번에 조회)
+_EXPORT_CHUNK_SIZE = 500
+
+
 @router.get(
     "/export",
     summary="전체 API 내보내기",
-    description="모든 API 정의를 JSON으로 내보냅니다.",
+    description=(
+        "모든 API 정의를 JSON으로 내보냅니다. 조회하는 대로 스트리밍으로 전송합니다.\n\n"
+        "- 기본: 가져오기(`/admin/import`)에 그대로 사용할 수 있는 단일 JSON 문서\n"
+        "- `ndjson=true`: API 하나당 한 줄(NDJSON)"
+    ),
 )
 async def export_apis(
     include_inactive: bool = Query(False, description="비활성화된 API 포함"),
-    db: AsyncSession = Depends(get_db),
+    ndjson: bool = Query(False, description="NDJSON 형식(API당 한 줄)으로 내보내기"),
 ):
     """모든 API를 JSON으로 내보냅니다."""
-    query = select(ApiRoute).where(ApiRoute.DEL_YN == 'N')
+    # 내보내기에 쓰는 컬럼만 조회하고 ORM 객체 대신 행(mapping)을 그대로 사용
+    query = select(
+        ApiRoute.ROUTE_ID,
+        ApiRoute.API_PATH,
+        ApiRoute.HTTP_MTHD,
+        ApiRoute.API_NAME,
+        ApiRoute.API_DESC,
+        ApiRoute.TAGS,
+        ApiRoute.USE_YN,
+        ApiRoute.AUTH_YN,
+        ApiRoute.RATE_LMT,
+        ApiRoute.CREA_DT,
+    ).where(ApiRoute.DEL_YN == 'N')
     if not include_inactive:
         query = query.where(ApiRoute.USE_YN == 'Y')
+    query = (
+        query
+        .order_by(ApiRoute.CREA_DT, ApiRoute.ROUTE_ID)
+        .execution_options(yield_per=_EXPORT_CHUNK_SIZE)
+    )
+    exported_at = datetime.utcnow()
     
-    result = await db.execute(query)
-    routes = result.scalars().all()
-    
-    export_data = {
-        "version": "1.7.0",
-        "exported_at": datetime.utcnow().isoformat(),
-        "total_apis": len(routes),
-        "apis": [],
-    }
-    
-    for route in routes:
-        # 현재 버전 조회
-        current_version = await ApiVersionService.get_current_version(db, route.ROUTE_ID)
-        
-        # 모든 버전 조회
-        versions_result = await db.execute(
-            select(ApiVersion)
-            .where(ApiVersion.ROUTE_ID == route.ROUTE_ID)
-            .order_by(ApiVersion.VERSION_NO)
-        )
-        versions = versions_result.scalars().all()
-        
-        api_data = {
-            "route": {
-                "id": route.ROUTE_ID,
-                "path": route.API_PATH,
-                "method": route.HTTP_MTHD,
-                "name": route.API_NAME,
-                "description": route.API_DESC,
-                "tags": route.TAGS,
-                "is_active": route.USE_YN == 'Y',
-                "require_auth": route.AUTH_YN == 'Y',
-                "rate_limit": route.RATE_LMT,
-                "created_at": route.CREA_DT.isoformat() if route.CREA_DT else None,
-            },
-            "versions": [
-                {
-                    "version": v.VERSION_NO,
-                    "is_current": v.CRNT_YN == 'Y',
-                    "request_spec": v.REQ_SPEC,
-                    "logic_type": v.LOGIC_TYPE,
-                    "logic_body": v.LOGIC_BODY,
-                    "logic_config": v.LOGIC_CFG,
-                    "response_spec": v.RESP_SPEC,
-                    "sample_params": v.SMPL_PARAMS,
-                    "change_note": v.CHG_NOTE,
-                    "created_at": v.CREA_DT.isoformat() if v.CREA_DT else None,
-                }
-                for v in versions
-            ],
-        }
-        export_data["apis"].append(api_data)
+    async def stream_export():
+        # 라우트는 서버 사이드 커서로 읽는 중이므로 버전은 다른 세션(연결)에서 조회
+        async with async_session_maker() as session, async_session_maker() as version_session:
+            routes = await session.stream(query)
+            if not ndjson:
+                yield b'{"version":"1.7.0","exported_at":' + orjson.dumps(exported_at) + b',"apis":['
+            separator = b""
+            total = 0
+            
+            async for chunk in routes.mappings().partitions():
+                # 묶음 단위로 모든 버전을 한 번에 조회 (라우트별 조회 제거)
+                versions_result = await version_session.execute(
+                    select(
+                        ApiVersion.ROUTE_ID,
+                        ApiVersion.VERSION_NO,
+                        ApiVersion.CRNT_YN,
+                        ApiVersion.REQ_SPEC,
+                        ApiVersion.LOGIC_TYPE,
+                        ApiVersion.LOGIC_BODY,
+                        ApiVersion.LOGIC_CFG,
+                        ApiVersion.RESP_SPEC,
+                        ApiVersion.SMPL_PARAMS,
+                        ApiVersion.CHG_NOTE,
+                        ApiVersion.CREA_DT,
+                    )
+                    .where(ApiVersion.ROUTE_ID.in_([route["ROUTE_ID"] for route in chunk]))
+                    .order_by(ApiVersion.ROUTE_ID, ApiVersion.VERSION_NO)
+                )
+                versions_by_route: dict[str, list[dict[str, Any]]] = {}
+                for v in versions_result.mappings():
+                    versions_by_route.setdefault(v["ROUTE_ID"], []).append({
+                        "version": v["VERSION_NO"],
+                        "is_current": v["CRNT_YN"] == 'Y',
+                        "request_spec": v["REQ_SPEC"],
+                        "logic_type": v["LOGIC_TYPE"],
+                        "logic_body": v["LOGIC_BODY"],
+                        "logic_config": v["LOGIC_CFG"],
+                        "response_spec": v["RESP_SPEC"],
+                        "sample_params": v["SMPL_PARAMS"],
+                        "change_note": v["CHG_NOTE"],
+                        "created_at": v["CREA_DT"],
+                    })
+                
+                for route in chunk:
+                    api_data = orjson.dumps({
+                        "route": {
+                            "id": route["ROUTE_ID"],
+                            "path": route["API_PATH"],
+                            "method": route["HTTP_MTHD"],
+                            "name": route["API_NAME"],
+                            "description": route["API_DESC"],
+                            "tags": route["TAGS"],
+                            "is_active": route["USE_YN"] == 'Y',
+                            "require_auth": route["AUTH_YN"] == 'Y',
+                            "rate_limit": route["RATE_LMT"],
+                            "created_at": route["CREA_DT"],
+                        },
+                        "versions": versions_by_route.get(route["ROUTE_ID"], []),
+                    })
+                    if ndjson:
+                        yield api_data + b"\n"
+                    else:
+                        yield separator + api_data
+                        separator = b","
+                
+                total += len(chunk)
+            
+            if not ndjson:
+                # 전체 개수는 스트리밍이 끝나야 알 수 있으므로 마지막에 기록
+                yield b'],"total_apis":' + str(total).encode() + b'}'
     
-    return JSONResponse(
-        content=export_data,
+    extension = "ndjson" if ndjson else "json"
+    return StreamingResponse(
+        stream_export(),
+        media_type="application/x-ndjson" if ndjson else "application/json",
         headers={
-            "Content-Disposition": f"attachment; filename=api-export-{datetime.utcnow().strftime('%Y%m%d-%H%M%S')}.json"
-        }
+            "Content-Disposition": f"attachment; filename=api-export-{exported_at.strftime('%Y%m%d-%H%M%S')}.{extension}"
+        },
     )
 
 
@@ -1043,25 +1170,25 @@ async def export_apis(
     description="특정 API 정의를 JSON으로 내보냅니다.",
 )
 async def export_single_api(
-    route_id: str,
+    route_id: RouteId,
     db: AsyncSession = Depends(get_db),
 ):
     """특정 API를 JSON으로 내보냅니다."""
-    route = await ApiRouteService.get_by_id(db, route_id, include_deleted=False)
+    # 모든 버전을 라우트와 함께 로딩 (IN 쿼리 1회, 버전의 다른 관계는 지연 로딩 금지)
+    route = await ApiRouteService.get_by_id(
+        db,
+        route_id,
+        include_deleted=False,
+        options=(selectinload(ApiRoute.versions).raiseload("*"),),
+    )
     if not route:
         raise HTTPException(status_code=404, detail="API를 찾을 수 없습니다.")
     
-    # 모든 버전 조회
-    versions_result = await db.execute(
-        select(ApiVersion)
-        .where(ApiVersion.ROUTE_ID == route.ROUTE_ID)
-        .order_by(ApiVersion.VERSION_NO)
-    )
-    versions = versions_result.scalars().all()
+    versions = sorted(route.versions, key=lambda v: v.VERSION_NO)
     
     export_data = {
         "version": "1.7.0",
-        "exported_at": datetime.utcnow().isoformat(),
+        "exported_at": datetime.utcnow(),
         "route": {
             "id": route.ROUTE_ID,
             "path": route.API_PATH,
@@ -1069,14 +1196,14 @@ async def export_single_api(
             "name": route.API_NAME,
             "description": route.API_DESC,
             "tags": route.TAGS,
-            "is_active": route.USE_YN == 'Y',
-            "require_auth": route.AUTH_YN == 'Y',
+            "is_active": route.is_active,
+            "require_auth": route.require_auth,
             "rate_limit": route.RATE_LMT,
         },
         "versions": [
             {
                 "version": v.VERSION_NO,
-                "is_current": v.CRNT_YN == 'Y',
+                "is_current": v.is_current,
                 "request_spec": v.REQ_SPEC,
                 "logic_type": v.LOGIC_TYPE,
                 "logic_body": v.LOGIC_BODY,
@@ -1089,7 +1216,8 @@ async def export_single_api(
         ],
     }
     
-    return JSONResponse(content=export_data)
+    # datetime은 orjson이 직접 직렬화 (jsonable_encoder 변환 생략)
+    return ORJSONResponse(export_data)
 
 
 @router.post(
@@ -1107,72 +1235,119 @@ async def import_apis(
     imported = []
     skipped = []
     errors = []
+    client_ip = get_client_ip(request)  # 라우트/버전마다 헤더를 다시 파싱하지 않음
     
+    # 1) DB 접근 전에 모든 항목의 스키마 검증
+    candidates: list[tuple[ApiRouteCreate, list[ApiVersionCreate]]] = []
     for api_data in data.apis:
         try:
             route_data = api_data.get("route", {})
             versions_data = api_data.get("versions", [])
             
-            # 기존 라우트 확인
-            existing = await ApiRouteService.get_by_path_method(
-                db, route_data.get("path"), route_data.get("method")
+            route_create = ApiRouteCreate(
+                path=route_data.get("path"),
+                method=route_data.get("method"),
+                name=route_data.get("name"),
+                description=route_data.get("description"),
+                tags=route_data.get("tags"),
+                require_auth=route_data.get("require_auth", False),
+                rate_limit=int(route_data.get("rate_limit", 100)),
             )
-            
-            if existing and not data.overwrite:
+            # route_id는 라우트 생성 후 채움
+            version_creates = [
+                ApiVersionCreate(
+                    route_id="",
+                    request_spec=v_data.get("request_spec"),
+                    logic_type=v_data.get("logic_type", "SQL"),
+                    logic_body=v_data.get("logic_body"),
+                    logic_config=v_data.get("logic_config"),
+                    response_spec=v_data.get("response_spec"),
+                    sample_params=v_data.get("sample_params"),
+                    change_note=v_data.get("change_note", "가져오기로 생성"),
+                )
+                for v_data in versions_data
+            ]
+            candidates.append((route_create, version_creates))
+        except Exception as e:
+            errors.append({
+                "path": api_data.get("route", {}).get("path"),
+                "error": str(e),
+            })
+    
+    # 2) 기존 라우트 여부를 한 번에 조회 (라우트별 조회 제거)
+    existing = await ApiRouteService.get_existing_flags(
+        db, [(route_create.path, route_create.method) for route_create, _ in candidates]
+    )
+    
+    new_items: list[tuple[ApiRouteCreate, list[ApiVersionCreate]]] = []
+    seen: set[tuple[str, str]] = set()
+    for route_create, version_creates in candidates:
+        key = (route_create.path.lower(), route_create.method)
+        if key in seen or existing.get(key) == 'N':
+            # 이미 존재하거나 같은 요청 안에서 앞서 가져온 라우트
+            if not data.overwrite:
                 skipped.append({
-                    "path": route_data.get("path"),
-                    "method": route_data.get("method"),
+                    "path": route_create.path,
+                    "method": route_create.method,
                     "reason": "이미 존재함",
                 })
-                continue
-            
-            # 새 라우트 생성 (Immutable이므로 기존 라우트가 있어도 새로 생성)
-            new_route = await ApiRouteService.create(
+            else:
+                # Immutable이므로 덮어쓰지 않음
+                errors.append({
+                    "path": route_create.path,
+                    "error": f"이미 존재하는 API입니다: {route_create.path} [{route_create.method}]",
+                })
+            continue
+        seen.add(key)
+        
+        if key not in existing:
+            new_items.append((route_create, version_creates))
+            continue
+        
+        # 삭제된 라우트는 기존 생성 경로로 복원 후 버전을 이어서 추가
+        try:
+            route = await ApiRouteService.create(
                 db=db,
-                data=ApiRouteCreate(
-                    path=route_data.get("path"),
-                    method=route_data.get("method"),
-                    name=route_data.get("name"),
-                    description=route_data.get("description"),
-                    tags=route_data.get("tags"),
-                    require_auth=route_data.get("require_auth", False),
-                    rate_limit=int(route_data.get("rate_limit", 100)),
-                ),
+                data=route_create,
                 actor="import",
-                actor_ip=get_client_ip(request),
+                actor_ip=client_ip,
             )
-            
-            # 버전 생성
-            for v_data in versions_data:
+            for version_create in version_creates:
+                version_create.route_id = route.ROUTE_ID
                 await ApiVersionService.create(
                     db=db,
-                    data=ApiVersionCreate(
-                        route_id=new_route.ROUTE_ID,
-                        request_spec=v_data.get("request_spec"),
-                        logic_type=v_data.get("logic_type", "SQL"),
-                        logic_body=v_data.get("logic_body"),
-                        logic_config=v_data.get("logic_config"),
-                        response_spec=v_data.get("response_spec"),
-                        sample_params=v_data.get("sample_params"),
-                        change_note=v_data.get("change_note", "가져오기로 생성"),
-                    ),
+                    data=version_create,
                     actor="import",
-                    actor_ip=get_client_ip(request),
+                    actor_ip=client_ip,
                 )
-            
             imported.append({
-                "id": new_route.ROUTE_ID,
-                "path": new_route.API_PATH,
-                "method": new_route.HTTP_MTHD,
-                "versions": len(versions_data),
+                "id": route.ROUTE_ID,
+                "path": route.API_PATH,
+                "method": route.HTTP_MTHD,
+                "versions": len(version_creates),
             })
-            
         except Exception as e:
             errors.append({
-                "path": api_data.get("route", {}).get("path"),
+                "path": route_create.path,
                 "error": str(e),
             })
     
+    # 3) 새 라우트/버전/감사 로그는 종류별 INSERT 1회씩 (요청 트랜잭션에서 함께 커밋)
+    if new_items:
+        route_ids = await ApiRouteService.create_many(
+            db, new_items, actor="import", actor_ip=client_ip
+        )
+        for route_id, (route_create, version_creates) in zip(route_ids, new_items):
+            imported.append({
+                "id": route_id,
+                "path": route_create.path,
+                "method": route_create.method,
+                "versions": len(version_creates),
+            })
+    
+    if imported:
+        invalidate_route_cache()
+    
     return ResponseBase(
         message=f"가져오기 완료: {len(imported)}개 성공, {len(skipped)}개 건너뜀, {len(errors)}개 오류",
         data={
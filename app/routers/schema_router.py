@@ -2,14 +2,19 @@
 스키마 라우터
 DB 테이블 스키마 조회, API 테스트, LLM 기반 API 생성
 """
+import orjson
+import re
+from datetime import timedelta
+from decimal import Decimal
 from typing import Optional, Any
 from fastapi import APIRouter, Depends, HTTPException, Query
-from pydantic import BaseModel
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel, Field
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.database import get_db, get_readonly_db
-from app.schemas.common import ResponseBase
+from app.core.database import async_session_maker, get_db, get_readonly_db
+from app.schemas.common import ID_PATTERN, ResponseBase
 from app.services import schema_service
 from app.services.llm_service import (
     get_supported_models,
@@ -130,6 +135,43 @@ async def get_table_sample(
 
 # ==================== SQL 테스트 ====================
 
+# 테스트 실행을 막는 쿼리 키워드 (단어 경계로 비교하여 UPDATED_AT 같은 식별자는 허용)
+_DANGEROUS_SQL_RE = re.compile(
+    r"\b(DROP|TRUNCATE|DELETE|ALTER|CREATE|INSERT|UPDATE)\b", re.IGNORECASE
+)
+
+
+def _json_default(val: Any) -> Any:
+    """orjson이 직접 직렬화하지 못하는 DB 값 변환 (datetime/date는 orjson이 처리)"""
+    if isinstance(val, Decimal):
+        return float(val)
+    if isinstance(val, bytes):
+        try:
+            return val.decode("utf-8")
+        except UnicodeDecodeError:
+            return f"<bytes: {len(val)} bytes>"
+    if isinstance(val, timedelta):
+        # MySQL TIME 컬럼 (기존 응답과 같이 초 단위 숫자)
+        return val.total_seconds()
+    if isinstance(val, set):
+        # MySQL SET 컬럼
+        return list(val)
+    raise TypeError
+
+
+def _encode_rows(columns: list[str], rows) -> bytes:
+    """행 묶음을 JSON 배열 내부 바이트로 직렬화 (앞뒤 대괄호 제외)"""
+    # 값 변환은 orjson 직렬화 시 한 번에 처리 (셀마다 Python 변환 함수 호출 생략)
+    return orjson.dumps([dict(zip(columns, row)) for row in rows], default=_json_default)[1:-1]
+
+
+# 테스트 결과를 한 번에 읽어 직렬화할 행 수
+_TEST_SQL_CHUNK_SIZE = 1000
+
+# 스트리밍 응답 앞부분 (성공 여부, row_count, execution_time_ms, message는 행 목록 뒤에 전송)
+_TEST_SQL_PREFIX = b'{"success":true,"data":{"columns":'
+
+
 class TestSqlRequest(BaseModel):
     """SQL 테스트 요청"""
     logic_type: str = "SQL"
@@ -144,71 +186,43 @@ class TestSqlRequest(BaseModel):
 )
 async def test_sql(
     request: TestSqlRequest,
-    db: AsyncSession = Depends(get_db),
 ):
     """
     SQL 테스트 실행
     
     - 실제 DB에서 쿼리 실행
-    - 결과 및 실행 시간 반환
-    - 오류 발생 시 상세 에러 메시지 반환
+    - 결과를 조회하는 대로 스트리밍, 실행 시간은 마지막에 반환
+    - 오류 발생 시 상세 에러 메시지 반환 (행 전송 중 오류는 마지막에 error 필드로 반환)
     """
     import time
-    from datetime import datetime, date
-    from decimal import Decimal
     
-    # 위험한 쿼리 차단
-    dangerous_patterns = ["DROP ", "TRUNCATE ", "DELETE ", "ALTER ", "CREATE ", "INSERT ", "UPDATE "]
-    logic_upper = request.logic_body.upper()
-    for pattern in dangerous_patterns:
-        if pattern in logic_upper:
-            raise HTTPException(
-                status_code=400,
-                detail={"error": "FORBIDDEN_QUERY", "message": f"테스트에서는 {pattern.strip()} 쿼리를 실행할 수 없습니다."}
-            )
+    # 위험한 쿼리 차단 (대문자 사본을 만들지 않고 원문을 한 번만 검사)
+    match = _DANGEROUS_SQL_RE.search(request.logic_body)
+    if match:
+        raise HTTPException(
+            status_code=400,
+            detail={"error": "FORBIDDEN_QUERY", "message": f"테스트에서는 {match.group(1).upper()} 쿼리를 실행할 수 없습니다."}
+        )
     
     start_time = time.time()
     
+    # 응답 전송 중에도 결과를 읽으므로 요청 의존성 세션 대신 자체 세션 사용
+    # (테스트 쿼리는 커밋하지 않고 세션 종료 시 롤백)
+    session = async_session_maker()
     try:
-        # SQL 실행
-        result = await db.execute(text(request.logic_body), request.params)
-        rows = result.fetchall()
-        columns = list(result.keys())
-        
-        # 데이터 직렬화
-        def serialize_value(val):
-            if val is None:
-                return None
-            if isinstance(val, (datetime, date)):
-                return val.isoformat()
-            if isinstance(val, Decimal):
-                return float(val)
-            if isinstance(val, bytes):
-                try:
-                    return val.decode("utf-8")
-                except:
-                    return f"<bytes: {len(val)} bytes>"
-            return val
-        
-        data = [
-            {col: serialize_value(val) for col, val in zip(columns, row)}
-            for row in rows
-        ]
-        
-        execution_time = round((time.time() - start_time) * 1000, 2)
-        
-        return ResponseBase(
-            message="테스트 성공",
-            data={
-                "success": True,
-                "columns": columns,
-                "data": data,
-                "row_count": len(data),
-                "execution_time_ms": execution_time,
-            }
+        # SQL 실행 (서버 사이드 커서로 결과를 나눠 읽음)
+        result = await session.stream(
+            text(request.logic_body).execution_options(yield_per=_TEST_SQL_CHUNK_SIZE),
+            request.params,
         )
+        columns = list(result.keys())
+        partitions = result.partitions()
         
+        # 첫 묶음은 응답 시작 전에 조회/직렬화하여 대부분의 오류를 기존 실패 응답으로 반환
+        first = await anext(partitions, None)
+        first_chunk = _encode_rows(columns, first) if first else b""
     except Exception as e:
+        await session.close()
         execution_time = round((time.time() - start_time) * 1000, 2)
         return ResponseBase(
             message="테스트 실패",
@@ -219,6 +233,30 @@ async def test_sql(
                 "execution_time_ms": execution_time,
             }
         )
+    
+    async def stream_rows():
+        row_count = len(first) if first else 0
+        tail = {"success": True}
+        try:
+            yield _TEST_SQL_PREFIX + orjson.dumps(columns) + b',"data":[' + first_chunk
+            separator = b"," if first_chunk else b""
+            try:
+                async for partition in partitions:
+                    yield separator + _encode_rows(columns, partition)
+                    separator = b","
+                    row_count += len(partition)
+            except Exception as e:
+                # 이미 전송한 행은 유지하고 JSON을 정상적으로 닫은 뒤 오류 정보 전달
+                tail = {"success": False, "error": str(e), "error_type": type(e).__name__}
+            
+            tail["row_count"] = row_count
+            tail["execution_time_ms"] = round((time.time() - start_time) * 1000, 2)
+            message = "테스트 성공" if tail["success"] else "테스트 실패"
+            yield b"]," + orjson.dumps(tail)[1:] + b',"message":' + orjson.dumps(message) + b"}"
+        finally:
+            await session.close()
+    
+    return StreamingResponse(stream_rows(), media_type="application/json")
 
 
 class GetSampleValuesRequest(BaseModel):
@@ -475,7 +513,7 @@ async def optimize_sql_endpoint(
 
 class GenerateTestCasesRequest(BaseModel):
     """테스트 케이스 생성 요청"""
-    route_id: str
+    route_id: str = Field(..., pattern=ID_PATTERN)
     # LLM 설정
     model: str = "vertex_ai/gemini-2.5-flash"
     api_key: Optional[str] = None
@@ -583,15 +621,19 @@ async def chat_api_endpoint(
     from app.services import api_route_service, api_version_service
     from app.services.executor_service import ExecutorService
     
-    # 활성화된 API 목록 조회
-    routes_data, total = await api_route_service.ApiRouteService.list_routes(db, page=1, size=100)
+    # 활성화된 API 목록 조회 (전체 개수는 쓰지 않으므로 COUNT 없는 키셋 조회 사용)
+    routes_data, _ = await api_route_service.ApiRouteService.list_routes_after(db, size=100)
+    
+    # 현재 버전은 라우트별로 조회하지 않고 한 번에 조회
+    current_versions = await api_version_service.ApiVersionService.get_current_versions_bulk(
+        db, [route.id for route in routes_data]
+    )
     
     # API 정보 정리 (LLM에 전달할 형식)
     available_apis = []
     for route in routes_data:
         if route.is_active:
-            # 현재 버전 조회
-            version = await api_version_service.ApiVersionService.get_current_version(db, route.id)
+            version = current_versions.get(route.id)
             available_apis.append({
                 "route_id": route.id,
                 "path": route.path,
@@ -13,7 +13,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.database import get_db
 from app.services.api_route_service import ApiRouteService
-from app.services.api_version_service import ApiVersionService
+from app.services.api_version_service import ApiVersionService, EXECUTION_LOAD_OPTIONS
 from app.services.validator_service import ValidatorService, ValidationError
 from app.services.executor_service import ExecutorService, ExecutorError
 
@@ -148,7 +148,9 @@ async def universal_endpoint(
     
     # 2. API 버전 조회
     if _version:
-        version = await ApiVersionService.get_version_by_number(db, route.ROUTE_ID, _version)
+        version = await ApiVersionService.get_version_by_number(
+            db, route.ROUTE_ID, _version, options=EXECUTION_LOAD_OPTIONS
+        )
         if not version:
             raise HTTPException(
                 status_code=404,
@@ -158,7 +160,9 @@ async def universal_endpoint(
                 }
             )
     else:
-        version = await ApiVersionService.get_current_version(db, route.ROUTE_ID)
+        version = await ApiVersionService.get_current_version(
+            db, route.ROUTE_ID, options=EXECUTION_LOAD_OPTIONS
+        )
         if not version:
             raise HTTPException(
                 status_code=500,
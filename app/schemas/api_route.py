@@ -2,7 +2,7 @@
 API 라우트 스키마 정의
 """
 from typing import Optional, Literal
-from pydantic import BaseModel, Field, field_validator
+from pydantic import AliasChoices, BaseModel, Field, field_validator
 from datetime import datetime
 import re
 
@@ -66,7 +66,10 @@ class ApiRouteResponse(BaseModel):
     created_at: datetime
     updated_at: datetime
     created_by: Optional[str]
-    current_version: Optional[int] = None  # 현재 활성 버전
+    # 현재 활성 버전 (ORM 객체에서는 CRNT_VERSION_NO 컬럼 값인 current_version_no를 읽음)
+    current_version: Optional[int] = Field(
+        None, validation_alias=AliasChoices("current_version_no", "current_version")
+    )
     
     class Config:
         from_attributes = True
@@ -81,7 +84,9 @@ class ApiRouteListResponse(BaseModel):
     is_active: bool
     require_auth: bool
     created_at: datetime
-    current_version: Optional[int] = None
+    current_version: Optional[int] = Field(
+        None, validation_alias=AliasChoices("current_version_no", "current_version")
+    )
     
     class Config:
         from_attributes = True
@@ -7,6 +7,11 @@ from datetime import datetime
 
 T = TypeVar("T")
 
+# 식별자(ROUTE_ID, VERSION_ID 등) 입력 형식: 공백 없는 ASCII 1~50자
+# DB 식별자 컬럼은 ascii/ascii_bin이므로 ASCII가 아닌 값과 비교하면
+# MySQL 콜레이션 오류(1267)가 나므로 조회 전에 검증 단계에서 차단
+ID_PATTERN = r"^[\x21-\x7e]{1,50}$"
+
 
 class ResponseBase(BaseModel, Generic[T]):
     """기본 응답 스키마"""
@@ -51,3 +56,14 @@ class PaginatedResponse(BaseModel, Generic[T]):
     class Config:
         from_attributes = True
 
+
+class CursorPaginatedResponse(BaseModel, Generic[T]):
+    """커서(키셋) 페이지네이션 응답 스키마"""
+    success: bool = True
+    data: list[T]
+    size: int
+    has_more: bool
+    next_cursor: Optional[str] = None  # 다음 페이지 요청 시 cursor로 전달
+    
+    class Config:
+        from_attributes = True
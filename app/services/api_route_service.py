@@ -5,12 +5,13 @@ API 라우트의 CRUD 작업을 처리합니다.
 from typing import Optional
 from datetime import datetime
 import uuid
-from sqlalchemy import select, and_, func
+from sqlalchemy import select, and_, or_, func, literal, insert, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.api_route import ApiRoute
 from app.models.api_version import ApiVersion
 from app.schemas.api_route import ApiRouteCreate, ApiRouteUpdate
+from app.schemas.api_version import ApiVersionCreate
 from app.services.audit_service import AuditService, generate_id
 from app.core.config import get_settings
 
@@ -25,14 +26,32 @@ class ApiRouteService:
         db: AsyncSession,
         route_id: str,
         include_deleted: bool = False,
+        options: tuple = (),
     ) -> Optional[ApiRoute]:
-        """ID로 라우트 조회"""
-        query = select(ApiRoute).where(ApiRoute.ROUTE_ID == route_id)
+        """
+        ID로 라우트 조회
+        
+        options: 로더 옵션 (예: selectinload(ApiRoute.versions))
+        """
+        query = select(ApiRoute).where(ApiRoute.ROUTE_ID == route_id).options(*options)
         if not include_deleted:
             query = query.where(ApiRoute.DEL_YN == 'N')
         result = await db.execute(query)
         return result.scalar_one_or_none()
     
+    @staticmethod
+    async def exists(
+        db: AsyncSession,
+        route_id: str,
+        include_deleted: bool = False,
+    ) -> bool:
+        """라우트 존재 여부 확인 (컬럼을 읽지 않고 PK 인덱스만 조회)"""
+        query = select(literal(1)).select_from(ApiRoute).where(ApiRoute.ROUTE_ID == route_id)
+        if not include_deleted:
+            query = query.where(ApiRoute.DEL_YN == 'N')
+        result = await db.execute(query.limit(1))
+        return result.first() is not None
+    
     @staticmethod
     async def get_by_path_method(
         db: AsyncSession,
@@ -52,6 +71,30 @@ class ApiRouteService:
         result = await db.execute(query)
         return result.scalar_one_or_none()
     
+    @staticmethod
+    async def get_existing_flags(
+        db: AsyncSession,
+        keys: list[tuple[str, str]],
+    ) -> dict[tuple[str, str], str]:
+        """
+        (경로, 메서드) 목록 중 이미 등록된 라우트의 DEL_YN을 한 번에 조회 (삭제된 라우트 포함)
+        
+        DB 비교 규칙(대소문자 무시)과 맞추기 위해 키의 경로는 소문자로 반환합니다.
+        같은 경로+메서드에 삭제되지 않은 라우트가 있으면 'N'이 우선합니다.
+        """
+        if not keys:
+            return {}
+        result = await db.execute(
+            select(ApiRoute.API_PATH, ApiRoute.HTTP_MTHD, ApiRoute.DEL_YN)
+            .where(tuple_(ApiRoute.API_PATH, ApiRoute.HTTP_MTHD).in_(keys))
+        )
+        flags: dict[tuple[str, str], str] = {}
+        for path, method, del_yn in result.all():
+            key = (path.lower(), method)
+            if flags.get(key) != 'N':
+                flags[key] = del_yn
+        return flags
+    
     @staticmethod
     async def list_routes(
         db: AsyncSession,
@@ -60,29 +103,83 @@ class ApiRouteService:
         include_inactive: bool = False,
         include_deleted: bool = False,
     ) -> tuple[list[ApiRoute], int]:
-        """라우트 목록 조회"""
+        """
+        라우트 목록 조회 (OFFSET 페이지네이션)
+        
+        전체 개수는 윈도 함수 COUNT(*) OVER()로 같은 SELECT에서 함께 계산합니다.
+        현재 버전 번호는 라우트 행의 CRNT_VERSION_NO를 사용하므로 버전 테이블은 조회하지 않습니다.
+        """
+        conditions = []
+        if not include_inactive:
+            conditions.append(ApiRoute.USE_YN == 'Y')
+        if not include_deleted:
+            conditions.append(ApiRoute.DEL_YN == 'N')
+        
+        # 페이지네이션
+        offset = (page - 1) * size
+        query = (
+            select(ApiRoute, func.count().over().label("total"))
+            .where(*conditions)
+            .order_by(ApiRoute.CREA_DT.desc(), ApiRoute.ROUTE_ID.desc())
+            .offset(offset)
+            .limit(size)
+        )
+        
+        result = await db.execute(query)
+        rows = result.all()
+        if rows:
+            return [row[0] for row in rows], rows[0].total
+        
+        # 범위를 벗어난 페이지는 행이 없어 윈도 함수 값도 없으므로 개수만 따로 조회
+        if offset == 0:
+            return [], 0
+        count_result = await db.execute(select(func.count(ApiRoute.ROUTE_ID)).where(*conditions))
+        return [], count_result.scalar()
+    
+    @staticmethod
+    async def list_routes_after(
+        db: AsyncSession,
+        cursor: Optional[tuple[datetime, str]] = None,
+        size: int = 20,
+        include_inactive: bool = False,
+        include_deleted: bool = False,
+    ) -> tuple[list[ApiRoute], bool]:
+        """
+        라우트 목록 조회 (키셋 페이지네이션)
+        
+        (CREA_DT, ROUTE_ID) 내림차순으로 cursor 다음 행부터 조회하므로
+        OFFSET처럼 앞 페이지 행을 건너뛰며 읽지 않습니다.
+        전체 개수 대신 size + 1건을 조회해 다음 페이지 존재 여부만 판별합니다.
+        
+        Returns:
+            (라우트 목록, 다음 페이지 존재 여부)
+        """
         query = select(ApiRoute)
-        count_query = select(func.count(ApiRoute.ROUTE_ID))
         
         if not include_inactive:
             query = query.where(ApiRoute.USE_YN == 'Y')
-            count_query = count_query.where(ApiRoute.USE_YN == 'Y')
         
         if not include_deleted:
             query = query.where(ApiRoute.DEL_YN == 'N')
-            count_query = count_query.where(ApiRoute.DEL_YN == 'N')
         
-        # 페이지네이션
-        offset = (page - 1) * size
-        query = query.order_by(ApiRoute.CREA_DT.desc()).offset(offset).limit(size)
+        if cursor is not None:
+            # (CREA_DT, ROUTE_ID) < (:crea_dt, :route_id)
+            # MySQL이 행 생성자 비교보다 안정적으로 인덱스 범위 스캔을 쓰도록 풀어서 작성
+            crea_dt, route_id = cursor
+            query = query.where(
+                or_(
+                    ApiRoute.CREA_DT < crea_dt,
+                    and_(ApiRoute.CREA_DT == crea_dt, ApiRoute.ROUTE_ID < route_id),
+                )
+            )
         
-        result = await db.execute(query)
-        routes = result.scalars().all()
+        query = query.order_by(ApiRoute.CREA_DT.desc(), ApiRoute.ROUTE_ID.desc()).limit(size + 1)
         
-        count_result = await db.execute(count_query)
-        total = count_result.scalar()
+        result = await db.execute(query)
+        routes = list(result.scalars().all())
+        has_more = len(routes) > size
         
-        return routes, total
+        return routes[:size], has_more
     
     @staticmethod
     async def create(
@@ -154,6 +251,90 @@ class ApiRouteService:
         
         return route
     
+    @staticmethod
+    async def create_many(
+        db: AsyncSession,
+        items: list[tuple[ApiRouteCreate, list[ApiVersionCreate]]],
+        actor: Optional[str] = None,
+        actor_ip: Optional[str] = None,
+    ) -> list[str]:
+        """
+        새 라우트와 버전 일괄 생성 (가져오기용)
+        
+        라우트, 버전, 감사 로그를 각각 INSERT 1회(executemany)로 기록합니다.
+        중복 검사는 호출 측에서 수행해야 하며, 라우트별 마지막 버전이 현재 버전이 됩니다.
+        
+        Returns:
+            생성된 ROUTE_ID 목록 (items 순서)
+        """
+        route_rows = []
+        version_rows = []
+        audit_entries = []
+        
+        for data, versions in items:
+            route_id = generate_id()
+            route_row = {
+                "ROUTE_ID": route_id,
+                "API_PATH": data.path,
+                "HTTP_MTHD": data.method.upper(),
+                "API_NAME": data.name,
+                "API_DESC": data.description,
+                "TAGS": data.tags,
+                "AUTH_YN": 'Y' if data.require_auth else 'N',
+                "ALWD_ORGNS": data.allowed_origins,
+                "RATE_LMT": str(data.rate_limit),
+                "USE_YN": 'Y',
+                "DEL_YN": 'N',
+                "CRNT_VERSION_NO": len(versions) or None,
+                "CREA_BY": actor,
+                "UPDT_BY": actor,
+            }
+            route_rows.append(route_row)
+            audit_entries.append({
+                "target_type": "API_ROUTE",
+                "target_id": route_id,
+                "action": "CREATE",
+                "new_value": route_row,
+                "description": f"새 라우트 생성: {data.path} [{data.method}]",
+                "actor": actor,
+                "actor_ip": actor_ip,
+            })
+            
+            for version_no, version_data in enumerate(versions, start=1):
+                version_row = {
+                    "VERSION_ID": generate_id(),
+                    "ROUTE_ID": route_id,
+                    "VERSION_NO": version_no,
+                    "CRNT_YN": 'Y' if version_no == len(versions) else 'N',
+                    "REQ_SPEC": version_data.request_spec,
+                    "LOGIC_TYPE": version_data.logic_type,
+                    "LOGIC_BODY": version_data.logic_body,
+                    "LOGIC_CFG": version_data.logic_config,
+                    "RESP_SPEC": version_data.response_spec,
+                    "STATUS_CDS": version_data.status_codes,
+                    "SMPL_PARAMS": version_data.sample_params,
+                    "CHG_NOTE": version_data.change_note,
+                    "CREA_BY": actor,
+                }
+                version_rows.append(version_row)
+                audit_entries.append({
+                    "target_type": "API_VERSION",
+                    "target_id": version_row["VERSION_ID"],
+                    "action": "VERSION_CREATE",
+                    "new_value": version_row,
+                    "description": f"새 버전 생성: {data.path} v{version_no}",
+                    "actor": actor,
+                    "actor_ip": actor_ip,
+                })
+        
+        if route_rows:
+            await db.execute(insert(ApiRoute), route_rows)
+        if version_rows:
+            await db.execute(insert(ApiVersion), version_rows)
+        await AuditService.log_many(db, audit_entries)
+        
+        return [row["ROUTE_ID"] for row in route_rows]
+    
     @staticmethod
     async def update(
         db: AsyncSession,
@@ -3,8 +3,9 @@ API 버전 서비스
 API 버전의 CRUD 작업을 처리합니다.
 """
 from typing import Optional
-from sqlalchemy import select, and_, func
+from sqlalchemy import select, and_, func, update
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import defer
 
 from app.models.api_version import ApiVersion
 from app.models.api_route import ApiRoute
@@ -12,6 +13,14 @@ from app.schemas.api_version import ApiVersionCreate
 from app.services.audit_service import AuditService, generate_id
 
 
+# API 실행 경로에서 사용하지 않는 컬럼은 로딩/JSON 디코딩 생략
+# (접근 시 지연 로딩 대신 예외 발생 - 비동기 세션에서 숨은 쿼리 방지)
+EXECUTION_LOAD_OPTIONS = (
+    defer(ApiVersion.SMPL_PARAMS, raiseload=True),
+    defer(ApiVersion.CHG_NOTE, raiseload=True),
+)
+
+
 class ApiVersionService:
     """API 버전 서비스"""
     
@@ -24,21 +33,29 @@ class ApiVersionService:
         return result.scalar_one_or_none()
     
     @staticmethod
-    async def get_current_version(db: AsyncSession, route_id: str) -> Optional[ApiVersion]:
+    async def get_current_version(
+        db: AsyncSession,
+        route_id: str,
+        options: tuple = (),
+    ) -> Optional[ApiVersion]:
         """
         라우트의 현재(최신) 버전 조회
         
         CRNT_YN='Y'인 버전을 우선 반환하고,
         없으면 가장 높은 VERSION_NO를 가진 버전 반환
+        
+        options: 로더 옵션 (예: EXECUTION_LOAD_OPTIONS)
         """
         # CRNT_YN='Y'인 버전 먼저 확인
         result = await db.execute(
-            select(ApiVersion).where(
+            select(ApiVersion)
+            .where(
                 and_(
                     ApiVersion.ROUTE_ID == route_id,
                     ApiVersion.CRNT_YN == 'Y',
                 )
             )
+            .options(*options)
         )
         version = result.scalar_one_or_none()
         
@@ -51,23 +68,79 @@ class ApiVersionService:
             .where(ApiVersion.ROUTE_ID == route_id)
             .order_by(ApiVersion.VERSION_NO.desc())
             .limit(1)
+            .options(*options)
         )
         return result.scalar_one_or_none()
     
+    @staticmethod
+    async def get_current_versions_bulk(
+        db: AsyncSession,
+        route_ids: list[str],
+        options: tuple = (),
+    ) -> dict[str, ApiVersion]:
+        """
+        여러 라우트의 현재(최신) 버전을 한 번에 조회
+        
+        get_current_version과 같은 규칙(CRNT_YN='Y' 우선, 없으면 최고 VERSION_NO)을
+        라우트 수와 관계없이 최대 2회 쿼리로 처리합니다.
+        
+        Returns:
+            {ROUTE_ID: ApiVersion} (버전이 없는 라우트는 제외)
+        """
+        if not route_ids:
+            return {}
+        
+        result = await db.execute(
+            select(ApiVersion)
+            .where(
+                ApiVersion.ROUTE_ID.in_(route_ids),
+                ApiVersion.CRNT_YN == 'Y',
+            )
+            .options(*options)
+        )
+        versions = {v.ROUTE_ID: v for v in result.scalars()}
+        
+        # CRNT_YN='Y' 버전이 없는 라우트는 최신 버전으로 대체
+        missing = [route_id for route_id in route_ids if route_id not in versions]
+        if missing:
+            latest = (
+                select(ApiVersion.ROUTE_ID, func.max(ApiVersion.VERSION_NO).label("VERSION_NO"))
+                .where(ApiVersion.ROUTE_ID.in_(missing))
+                .group_by(ApiVersion.ROUTE_ID)
+                .subquery()
+            )
+            result = await db.execute(
+                select(ApiVersion)
+                .join(
+                    latest,
+                    and_(
+                        ApiVersion.ROUTE_ID == latest.c.ROUTE_ID,
+                        ApiVersion.VERSION_NO == latest.c.VERSION_NO,
+                    ),
+                )
+                .options(*options)
+            )
+            versions.update((v.ROUTE_ID, v) for v in result.scalars())
+        
+        return versions
+    
     @staticmethod
     async def get_version_by_number(
         db: AsyncSession,
         route_id: str,
         version_number: int,
+        options: tuple = (),
     ) -> Optional[ApiVersion]:
         """특정 버전 번호로 조회"""
         result = await db.execute(
-            select(ApiVersion).where(
+            select(ApiVersion)
+            .where(
                 and_(
                     ApiVersion.ROUTE_ID == route_id,
                     ApiVersion.VERSION_NO == version_number,
                 )
             )
+            .options(*options)
         )
         return result.scalar_one_or_none()
     
@@ -94,6 +167,48 @@ class ApiVersionService:
         max_version = result.scalar()
         return (max_version or 0) + 1
     
+    @staticmethod
+    async def _demote_current(
+        db: AsyncSession,
+        route_id: str,
+        keep_version: Optional[int] = None,
+    ) -> None:
+        """
+        라우트의 현재 버전(CRNT_YN='Y')을 'N'으로 일괄 변경
+        
+        MySQL은 UPDATE를 포함한 CTE/RETURNING을 지원하지 않으므로
+        버전 행을 모두 로드해 하나씩 바꾸는 대신 조건부 UPDATE 한 문장으로 처리합니다.
+        세션에 이미 로드된 버전 객체의 값은 갱신하지 않습니다.
+        """
+        stmt = (
+            update(ApiVersion)
+            .where(ApiVersion.ROUTE_ID == route_id, ApiVersion.CRNT_YN == 'Y')
+            .values(CRNT_YN='N')
+            .execution_options(synchronize_session=False)
+        )
+        if keep_version is not None:
+            stmt = stmt.where(ApiVersion.VERSION_NO != keep_version)
+        await db.execute(stmt)
+    
+    @staticmethod
+    async def _set_route_current(
+        db: AsyncSession,
+        route_id: str,
+        version_number: int,
+    ) -> None:
+        """
+        라우트의 비정규화된 현재 버전 번호(CRNT_VERSION_NO) 갱신
+        
+        버전 변경과 같은 트랜잭션에서 실행되어 함께 커밋/롤백됩니다.
+        세션에 이미 로드된 라우트 객체의 값은 갱신하지 않습니다.
+        """
+        await db.execute(
+            update(ApiRoute)
+            .where(ApiRoute.ROUTE_ID == route_id)
+            .values(CRNT_VERSION_NO=version_number)
+            .execution_options(synchronize_session=False)
+        )
+    
     @staticmethod
     async def create(
         db: AsyncSession,
@@ -122,12 +237,8 @@ class ApiVersionService:
         if not route:
             raise ValueError(f"존재하지 않는 라우트입니다: {route_id}")
         
-        # 모든 기존 버전의 CRNT_YN을 'N'으로
-        existing_versions = await db.execute(
-            select(ApiVersion).where(ApiVersion.ROUTE_ID == route_id)
-        )
-        for v in existing_versions.scalars():
-            v.CRNT_YN = 'N'
+        # 기존 현재 버전의 CRNT_YN을 'N'으로 (버전을 로드하지 않고 UPDATE 1회)
+        await ApiVersionService._demote_current(db, route_id)
         
         # 새 버전 번호 계산
         next_version = await ApiVersionService.get_next_version_number(db, route_id)
@@ -151,6 +262,9 @@ class ApiVersionService:
         db.add(version)
         await db.flush()
         
+        # 새 버전이 현재 버전이 되므로 라우트의 현재 버전 번호도 갱신
+        await ApiVersionService._set_route_current(db, route_id, next_version)
+        
         # 감사 로그
         await AuditService.log(
             db=db,
@@ -231,16 +345,13 @@ class ApiVersionService:
         if not target:
             return None
         
-        # 모든 버전의 CRNT_YN을 'N'으로
-        all_versions = await db.execute(
-            select(ApiVersion).where(ApiVersion.ROUTE_ID == route_id)
-        )
-        for v in all_versions.scalars():
-            v.CRNT_YN = 'N'
+        # 대상 외 현재 버전의 CRNT_YN을 'N'으로 (버전을 로드하지 않고 UPDATE 1회)
+        await ApiVersionService._demote_current(db, route_id, keep_version=version_number)
         
-        # 대상 버전을 current로
+        # 대상 버전을 current로 (이미 'Y'이면 UPDATE 없음)
         target.CRNT_YN = 'Y'
         await db.flush()
+        await ApiVersionService._set_route_current(db, route_id, version_number)
         
         # 감사 로그
         await AuditService.log(
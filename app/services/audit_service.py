@@ -4,6 +4,7 @@
 """
 from typing import Optional, Any
 import uuid
+from sqlalchemy import insert, inspect as sa_inspect
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.models.audit_log import AuditLog
 
@@ -53,21 +54,54 @@ class AuditService:
             ACTOR=actor,
             ACTOR_IP=actor_ip,
         )
+        # 즉시 flush하지 않음: 다음 flush/commit 시 대기 중인 로그와 함께 일괄 INSERT
         db.add(log_entry)
-        await db.flush()
         return log_entry
     
+    @staticmethod
+    async def log_many(db: AsyncSession, entries: list[dict[str, Any]]) -> int:
+        """
+        감사 로그 일괄 기록 (단일 INSERT 문, executemany)
+        
+        Args:
+            db: 데이터베이스 세션
+            entries: log()와 같은 키(target_type, target_id, action, old_value,
+                     new_value, description, actor, actor_ip)를 가진 딕셔너리 목록
+        
+        Returns:
+            기록된 로그 수
+        """
+        if not entries:
+            return 0
+        
+        rows = [
+            {
+                "AUDIT_ID": generate_id(),
+                "TRGT_TYPE": entry["target_type"],
+                "TRGT_ID": entry["target_id"],
+                "ACTION": entry["action"],
+                "OLD_VAL": entry.get("old_value"),
+                "NEW_VAL": entry.get("new_value"),
+                "DESC": entry.get("description"),
+                "ACTOR": entry.get("actor"),
+                "ACTOR_IP": entry.get("actor_ip"),
+            }
+            for entry in entries
+        ]
+        await db.execute(insert(AuditLog), rows)
+        return len(rows)
+    
     @staticmethod
     def model_to_dict(model: Any) -> dict:
-        """모델 객체를 딕셔너리로 변환 (감사 로그용)"""
+        """
+        모델 객체를 딕셔너리로 변환 (감사 로그용)
+        
+        datetime 등은 변환하지 않고 그대로 둡니다.
+        JSON 컬럼 저장 시 엔진의 orjson 직렬화기가 ISO 8601 문자열로 변환합니다.
+        매퍼에 매핑된 컬럼만 포함합니다. (CATEGORY_TAG, CRNT_ROUTE_ID처럼
+        exclude_properties로 제외한 가상 컬럼은 인스턴스 값이 없으므로 제외)
+        """
         if model is None:
             return None
         
-        result = {}
-        for column in model.__table__.columns:
-            value = getattr(model, column.name)
-            # datetime 객체는 문자열로 변환
-            if hasattr(value, 'isoformat'):
-                value = value.isoformat()
-            result[column.name] = value
-        return result
+        return {attr.key: getattr(model, attr.key) for attr in sa_inspect(model).mapper.column_attrs}
@@ -0,0 +1,49 @@
+"""
+첫 번째 태그(카테고리) 가상 컬럼 추가 (기존 DB 마이그레이션)
+
+APP_API_ROUTE_L에 TAGS의 첫 번째 태그를 담는 가상 컬럼(CATEGORY_TAG)과
+카테고리 조회용 인덱스(IDX_API_ROUTE_CATEGORY)를 추가합니다.
+
+Usage:
+    python scripts/add_category_tag_column.py
+"""
+import os
+import sys
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import asyncio
+from sqlalchemy import text
+from app.core.database import engine
+
+
+async def add_category_tag_column():
+    """CATEGORY_TAG 가상 컬럼과 IDX_API_ROUTE_CATEGORY 인덱스 추가"""
+    async with engine.begin() as conn:
+        try:
+            result = await conn.execute(text("""
+                SELECT 1
+                FROM information_schema.COLUMNS
+                WHERE TABLE_SCHEMA = DATABASE()
+                AND TABLE_NAME = 'APP_API_ROUTE_L'
+                AND COLUMN_NAME = 'CATEGORY_TAG'
+            """))
+            if result.first() is not None:
+                print("✅ CATEGORY_TAG 컬럼이 이미 존재합니다.")
+                return
+
+            await conn.execute(text("""
+                ALTER TABLE APP_API_ROUTE_L
+                ADD COLUMN CATEGORY_TAG VARCHAR(500) CHARACTER SET utf8mb4 COLLATE utf8mb4_bin
+                    GENERATED ALWAYS AS (NULLIF(TRIM(SUBSTRING_INDEX(TAGS, ',', 1)), '')) VIRTUAL
+                    COMMENT '첫 번째 태그 (카테고리 조회용)',
+                ADD INDEX IDX_API_ROUTE_CATEGORY (CATEGORY_TAG, DEL_YN)
+            """))
+            print("✅ CATEGORY_TAG 컬럼과 IDX_API_ROUTE_CATEGORY 인덱스가 추가되었습니다.")
+
+        except Exception as e:
+            print(f"❌ 에러: {e}")
+            raise
+
+
+if __name__ == "__main__":
+    asyncio.run(add_category_tag_column())
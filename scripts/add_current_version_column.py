@@ -0,0 +1,63 @@
+"""
+라우트 현재 버전 번호 컬럼 추가 (기존 DB 마이그레이션)
+
+APP_API_ROUTE_L에 현재 버전 번호(CRNT_VERSION_NO) 컬럼을 추가하고
+APP_API_VERSION_H의 현재 버전(없으면 최신 버전) 번호로 채웁니다.
+기존 라우트의 수정일시(UPDT_DT)는 바뀌지 않습니다.
+
+Usage:
+    python scripts/add_current_version_column.py
+"""
+import os
+import sys
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import asyncio
+from sqlalchemy import text
+from app.core.database import engine
+
+
+async def add_current_version_column():
+    """CRNT_VERSION_NO 컬럼 추가 및 기존 데이터 채우기"""
+    async with engine.begin() as conn:
+        try:
+            result = await conn.execute(text("""
+                SELECT 1
+                FROM information_schema.COLUMNS
+                WHERE TABLE_SCHEMA = DATABASE()
+                AND TABLE_NAME = 'APP_API_ROUTE_L'
+                AND COLUMN_NAME = 'CRNT_VERSION_NO'
+            """))
+            if result.first() is None:
+                await conn.execute(text("""
+                    ALTER TABLE APP_API_ROUTE_L
+                    ADD COLUMN CRNT_VERSION_NO INT NULL COMMENT '현재 버전 번호'
+                    AFTER RATE_LMT
+                """))
+                print("✅ CRNT_VERSION_NO 컬럼이 추가되었습니다.")
+            else:
+                print("✅ CRNT_VERSION_NO 컬럼이 이미 존재합니다.")
+
+            # 현재 버전(CRNT_YN='Y') 우선, 없으면 최신 버전 번호로 채움
+            result = await conn.execute(text("""
+                UPDATE APP_API_ROUTE_L r
+                JOIN (
+                    SELECT ROUTE_ID,
+                           COALESCE(MAX(CASE WHEN CRNT_YN = 'Y' THEN VERSION_NO END), MAX(VERSION_NO)) AS VERSION_NO
+                    FROM APP_API_VERSION_H
+                    GROUP BY ROUTE_ID
+                ) v ON v.ROUTE_ID = r.ROUTE_ID
+                SET r.CRNT_VERSION_NO = v.VERSION_NO,
+                    r.UPDT_DT = r.UPDT_DT
+                WHERE r.CRNT_VERSION_NO IS NULL
+                   OR r.CRNT_VERSION_NO <> v.VERSION_NO
+            """))
+            print(f"✅ {result.rowcount}개 라우트의 현재 버전 번호를 채웠습니다.")
+
+        except Exception as e:
+            print(f"❌ 에러: {e}")
+            raise
+
+
+if __name__ == "__main__":
+    asyncio.run(add_current_version_column())
@@ -0,0 +1,65 @@
+"""
+라우트당 현재 버전 1개 제약 추가 (기존 DB 마이그레이션)
+
+APP_API_VERSION_H에 CRNT_YN='Y'일 때만 ROUTE_ID 값을 갖는 가상 컬럼(CRNT_ROUTE_ID)과
+UNIQUE 인덱스(UK_API_VERSION_CRNT)를 추가합니다.
+이미 현재 버전이 2개 이상인 라우트가 있으면 목록을 출력하고 중단합니다.
+
+Usage:
+    python scripts/add_current_version_key.py
+"""
+import os
+import sys
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import asyncio
+from sqlalchemy import text
+from app.core.database import engine
+
+
+async def add_current_version_key():
+    """CRNT_ROUTE_ID 가상 컬럼과 UK_API_VERSION_CRNT 인덱스 추가"""
+    async with engine.begin() as conn:
+        try:
+            result = await conn.execute(text("""
+                SELECT 1
+                FROM information_schema.COLUMNS
+                WHERE TABLE_SCHEMA = DATABASE()
+                AND TABLE_NAME = 'APP_API_VERSION_H'
+                AND COLUMN_NAME = 'CRNT_ROUTE_ID'
+            """))
+            if result.first() is not None:
+                print("✅ CRNT_ROUTE_ID 컬럼이 이미 존재합니다.")
+                return
+
+            # 제약 위반 데이터 확인
+            result = await conn.execute(text("""
+                SELECT ROUTE_ID, COUNT(*)
+                FROM APP_API_VERSION_H
+                WHERE CRNT_YN = 'Y'
+                GROUP BY ROUTE_ID
+                HAVING COUNT(*) > 1
+            """))
+            duplicates = result.fetchall()
+            if duplicates:
+                print("❌ 현재 버전(CRNT_YN='Y')이 2개 이상인 라우트가 있습니다. 정리 후 다시 실행하세요.")
+                for route_id, count in duplicates:
+                    print(f"   - {route_id}: {count}개")
+                return
+
+            await conn.execute(text("""
+                ALTER TABLE APP_API_VERSION_H
+                ADD COLUMN CRNT_ROUTE_ID VARCHAR(50) CHARACTER SET ascii COLLATE ascii_bin
+                    GENERATED ALWAYS AS (CASE WHEN CRNT_YN = 'Y' THEN ROUTE_ID END) VIRTUAL
+                    COMMENT '현재 버전의 라우트 ID (UK_API_VERSION_CRNT용)',
+                ADD UNIQUE INDEX UK_API_VERSION_CRNT (CRNT_ROUTE_ID)
+            """))
+            print("✅ CRNT_ROUTE_ID 컬럼과 UK_API_VERSION_CRNT 인덱스가 추가되었습니다.")
+
+        except Exception as e:
+            print(f"❌ 에러: {e}")
+            raise
+
+
+if __name__ == "__main__":
+    asyncio.run(add_current_version_key())
@@ -0,0 +1,61 @@
+"""
+성능 개선용 인덱스 추가 (기존 DB 마이그레이션)
+
+create_all은 이미 존재하는 테이블의 인덱스를 변경하지 않으므로
+기존 DB에는 이 스크립트로 인덱스를 반영합니다.
+
+Usage:
+    python scripts/add_indexes.py
+"""
+import os
+import sys
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import asyncio
+from sqlalchemy import text
+from app.core.database import engine
+
+
+# (테이블, 추가할 인덱스, 컬럼 정의, 대체되어 삭제할 기존 인덱스)
+INDEXES = [
+    ("APP_API_ROUTE_L", "IDX_API_ROUTE_LOOKUP", "API_PATH, HTTP_MTHD, DEL_YN, USE_YN", "IDX_API_ROUTE_PATH_MTHD"),
+    ("APP_API_ROUTE_L", "IDX_API_ROUTE_CREA_DT", "CREA_DT, ROUTE_ID", None),
+    ("APP_API_AUDIT_H", "IDX_API_AUDIT_TRGT_CREA", "TRGT_TYPE, TRGT_ID, CREA_DT", "IDX_API_AUDIT_TRGT"),
+]
+
+
+async def _index_exists(conn, table: str, index: str) -> bool:
+    """인덱스 존재 여부 확인"""
+    result = await conn.execute(text("""
+        SELECT 1
+        FROM information_schema.STATISTICS
+        WHERE TABLE_SCHEMA = DATABASE()
+        AND TABLE_NAME = :table
+        AND INDEX_NAME = :index
+        LIMIT 1
+    """), {"table": table, "index": index})
+    return result.first() is not None
+
+
+async def add_indexes():
+    """INDEXES 목록의 인덱스를 추가하고 대체된 인덱스를 삭제"""
+    async with engine.begin() as conn:
+        try:
+            for table, index, columns, replaces in INDEXES:
+                if await _index_exists(conn, table, index):
+                    print(f"✅ {table}.{index} 인덱스가 이미 존재합니다.")
+                else:
+                    await conn.execute(text(f"ALTER TABLE {table} ADD INDEX {index} ({columns})"))
+                    print(f"✅ {table}.{index} 인덱스가 추가되었습니다.")
+                
+                if replaces and await _index_exists(conn, table, replaces):
+                    await conn.execute(text(f"ALTER TABLE {table} DROP INDEX {replaces}"))
+                    print(f"🗑️ {table}.{replaces} 인덱스를 삭제했습니다. ({index}로 대체)")
+            
+        except Exception as e:
+            print(f"❌ 에러: {e}")
+            raise
+
+
+if __name__ == "__main__":
+    asyncio.run(add_indexes())
@@ -0,0 +1,65 @@
+"""
+식별자 컬럼을 ASCII 바이너리 콜레이션으로 변환 (기존 DB 마이그레이션)
+
+ROUTE_ID, VERSION_ID, AUDIT_ID, TRGT_ID 컬럼을
+VARCHAR(50) CHARACTER SET ascii COLLATE ascii_bin으로 변경합니다.
+FK로 연결된 ROUTE_ID는 양쪽 타입이 같아야 하므로 FK 검사를 잠시 끄고 함께 변경합니다.
+변경 후 ASCII가 아닌 값과 비교하면 MySQL 콜레이션 오류(1267)가 나므로,
+API는 ASCII가 아닌 ID 입력을 조회 전에 검증 오류(400)로 거부합니다.
+
+Usage:
+    python scripts/convert_id_columns.py
+"""
+import os
+import sys
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import asyncio
+from sqlalchemy import text
+from app.core.database import engine
+
+
+# (테이블, 컬럼, 나머지 컬럼 정의)
+ID_COLUMNS = [
+    ("APP_API_ROUTE_L", "ROUTE_ID", "NOT NULL COMMENT '라우트 고유 ID'"),
+    ("APP_API_VERSION_H", "VERSION_ID", "NOT NULL COMMENT '버전 고유 ID'"),
+    ("APP_API_VERSION_H", "ROUTE_ID", "NOT NULL COMMENT '라우트 ID'"),
+    ("APP_API_AUDIT_H", "AUDIT_ID", "NOT NULL COMMENT '감사로그 고유 ID'"),
+    ("APP_API_AUDIT_H", "TRGT_ID", "NOT NULL COMMENT '대상 ID'"),
+]
+
+
+async def convert_id_columns():
+    """식별자 컬럼의 문자셋/콜레이션 변경"""
+    async with engine.begin() as conn:
+        try:
+            await conn.execute(text("SET FOREIGN_KEY_CHECKS = 0"))
+            for table, column, definition in ID_COLUMNS:
+                result = await conn.execute(text("""
+                    SELECT COLLATION_NAME
+                    FROM information_schema.COLUMNS
+                    WHERE TABLE_SCHEMA = DATABASE()
+                    AND TABLE_NAME = :table
+                    AND COLUMN_NAME = :column
+                """), {"table": table, "column": column})
+                collation = result.scalar_one_or_none()
+                
+                if collation == "ascii_bin":
+                    print(f"✅ {table}.{column} 컬럼은 이미 ascii_bin입니다.")
+                    continue
+                
+                await conn.execute(text(
+                    f"ALTER TABLE {table} MODIFY {column} "
+                    f"VARCHAR(50) CHARACTER SET ascii COLLATE ascii_bin {definition}"
+                ))
+                print(f"✅ {table}.{column} 컬럼을 ascii_bin으로 변경했습니다.")
+            
+        except Exception as e:
+            print(f"❌ 에러: {e}")
+            raise
+        finally:
+            await conn.execute(text("SET FOREIGN_KEY_CHECKS = 1"))
+
+
+if __name__ == "__main__":
+    asyncio.run(convert_id_columns())
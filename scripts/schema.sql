@@ -15,7 +15,7 @@ USE cliwant;
 -- 1. APP_API_ROUTE_L (API 라우트 리스트)
 -- ============================================
 CREATE TABLE IF NOT EXISTS APP_API_ROUTE_L (
-    ROUTE_ID VARCHAR(50) NOT NULL PRIMARY KEY COMMENT '라우트 고유 ID',
+    ROUTE_ID VARCHAR(50) CHARACTER SET ascii COLLATE ascii_bin NOT NULL PRIMARY KEY COMMENT '라우트 고유 ID',
     
     -- API 식별 정보
     API_PATH VARCHAR(255) NOT NULL COMMENT 'API 경로 (예: user-info, products)',
@@ -26,6 +26,11 @@ CREATE TABLE IF NOT EXISTS APP_API_ROUTE_L (
     API_DESC TEXT NULL COMMENT 'API 설명',
     TAGS VARCHAR(500) NULL COMMENT '태그 (쉼표로 구분)',
     
+    -- 첫 번째 태그(카테고리)를 담는 가상 컬럼 (카테고리 조회/집계용)
+    CATEGORY_TAG VARCHAR(500) CHARACTER SET utf8mb4 COLLATE utf8mb4_bin
+        GENERATED ALWAYS AS (NULLIF(TRIM(SUBSTRING_INDEX(TAGS, ',', 1)), '')) VIRTUAL
+        COMMENT '첫 번째 태그 (카테고리 조회용)',
+    
     -- 상태 관리
     USE_YN CHAR(1) NOT NULL DEFAULT 'Y' COMMENT '사용 여부 (Y/N)',
     DEL_YN CHAR(1) NOT NULL DEFAULT 'N' COMMENT '삭제 여부 (Y/N)',
@@ -35,6 +40,9 @@ CREATE TABLE IF NOT EXISTS APP_API_ROUTE_L (
     ALWD_ORGNS TEXT NULL COMMENT '허용된 Origin (CORS)',
     RATE_LMT VARCHAR(10) DEFAULT '100' COMMENT '분당 요청 제한',
     
+    -- 현재 버전 번호 (APP_API_VERSION_H의 현재 버전을 비정규화)
+    CRNT_VERSION_NO INT NULL COMMENT '현재 버전 번호',
+    
     -- 타임스탬프
     CREA_DT TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP COMMENT '생성일시',
     UPDT_DT TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP COMMENT '수정일시',
@@ -45,7 +53,9 @@ CREATE TABLE IF NOT EXISTS APP_API_ROUTE_L (
     UPDT_BY VARCHAR(100) NULL COMMENT '수정자',
     
     -- 인덱스
-    INDEX IDX_API_ROUTE_PATH_MTHD (API_PATH, HTTP_MTHD),
+    INDEX IDX_API_ROUTE_LOOKUP (API_PATH, HTTP_MTHD, DEL_YN, USE_YN),
+    INDEX IDX_API_ROUTE_CREA_DT (CREA_DT, ROUTE_ID),
+    INDEX IDX_API_ROUTE_CATEGORY (CATEGORY_TAG, DEL_YN),
     INDEX IDX_API_ROUTE_USE_YN (USE_YN),
     INDEX IDX_API_ROUTE_DEL_YN (DEL_YN)
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci
@@ -56,10 +66,10 @@ COMMENT='API 라우트 정의 테이블';
 -- 2. APP_API_VERSION_H (API 버전 히스토리)
 -- ============================================
 CREATE TABLE IF NOT EXISTS APP_API_VERSION_H (
-    VERSION_ID VARCHAR(50) NOT NULL PRIMARY KEY COMMENT '버전 고유 ID',
+    VERSION_ID VARCHAR(50) CHARACTER SET ascii COLLATE ascii_bin NOT NULL PRIMARY KEY COMMENT '버전 고유 ID',
     
     -- Foreign Key
-    ROUTE_ID VARCHAR(50) NOT NULL COMMENT '라우트 ID',
+    ROUTE_ID VARCHAR(50) CHARACTER SET ascii COLLATE ascii_bin NOT NULL COMMENT '라우트 ID',
     
     -- 버전 정보
     VERSION_NO INT NOT NULL COMMENT '버전 번호',
@@ -86,6 +96,11 @@ CREATE TABLE IF NOT EXISTS APP_API_VERSION_H (
     -- 생성자
     CREA_BY VARCHAR(100) NULL COMMENT '생성자',
     
+    -- 현재 버전일 때만 ROUTE_ID 값을 갖는 가상 컬럼 (라우트당 현재 버전 1개 보장용)
+    CRNT_ROUTE_ID VARCHAR(50) CHARACTER SET ascii COLLATE ascii_bin
+        GENERATED ALWAYS AS (CASE WHEN CRNT_YN = 'Y' THEN ROUTE_ID END) VIRTUAL
+        COMMENT '현재 버전의 라우트 ID (UK_API_VERSION_CRNT용)',
+    
     -- Foreign Key 제약
     CONSTRAINT FK_API_VERSION_ROUTE FOREIGN KEY (ROUTE_ID)
         REFERENCES APP_API_ROUTE_L(ROUTE_ID) ON DELETE RESTRICT ON UPDATE CASCADE,
@@ -95,7 +110,8 @@ CREATE TABLE IF NOT EXISTS APP_API_VERSION_H (
     INDEX IDX_API_VERSION_CRNT (ROUTE_ID, CRNT_YN),
     
     -- 유니크 제약
-    UNIQUE KEY UK_ROUTE_VERSION (ROUTE_ID, VERSION_NO)
+    UNIQUE KEY UK_ROUTE_VERSION (ROUTE_ID, VERSION_NO),
+    UNIQUE KEY UK_API_VERSION_CRNT (CRNT_ROUTE_ID)
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci
 COMMENT='API 버전 히스토리 테이블';
 
@@ -104,11 +120,11 @@ COMMENT='API 버전 히스토리 테이블';
 -- 3. APP_API_AUDIT_H (API 감사 로그)
 -- ============================================
 CREATE TABLE IF NOT EXISTS APP_API_AUDIT_H (
-    AUDIT_ID VARCHAR(50) NOT NULL PRIMARY KEY COMMENT '감사로그 고유 ID',
+    AUDIT_ID VARCHAR(50) CHARACTER SET ascii COLLATE ascii_bin NOT NULL PRIMARY KEY COMMENT '감사로그 고유 ID',
     
     -- 대상 정보
     TRGT_TYPE VARCHAR(50) NOT NULL COMMENT '대상 타입: API_ROUTE, API_VERSION',
-    TRGT_ID VARCHAR(50) NOT NULL COMMENT '대상 ID',
+    TRGT_ID VARCHAR(50) CHARACTER SET ascii COLLATE ascii_bin NOT NULL COMMENT '대상 ID',
     
     -- 작업 정보
     ACTION VARCHAR(50) NOT NULL COMMENT '작업 타입: CREATE, UPDATE, DELETE, RESTORE, ROLLBACK 등',
@@ -128,7 +144,7 @@ CREATE TABLE IF NOT EXISTS APP_API_AUDIT_H (
     CREA_DT TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP COMMENT '생성일시',
     
     -- 인덱스
-    INDEX IDX_API_AUDIT_TRGT (TRGT_TYPE, TRGT_ID),
+    INDEX IDX_API_AUDIT_TRGT_CREA (TRGT_TYPE, TRGT_ID, CREA_DT),
     INDEX IDX_API_AUDIT_ACTION (ACTION),
     INDEX IDX_API_AUDIT_CREA_DT (CREA_DT),
     INDEX IDX_API_AUDIT_ACTOR (ACTOR)
@@ -141,7 +157,7 @@ COMMENT='API 감사 로그 테이블';
 -- ============================================
 
 -- 샘플 API 1: Hello World
-INSERT INTO APP_API_ROUTE_L (ROUTE_ID, API_PATH, HTTP_MTHD, API_NAME, API_DESC, TAGS, USE_YN, DEL_YN, CREA_BY)
+INSERT INTO APP_API_ROUTE_L (ROUTE_ID, API_PATH, HTTP_MTHD, API_NAME, API_DESC, TAGS, USE_YN, DEL_YN, CRNT_VERSION_NO, CREA_BY)
 VALUES (
     UUID(),
     'hello',
@@ -151,6 +167,7 @@ VALUES (
     'sample,hello',
     'Y',
     'N',
+    1,
     'system'
 );
 
@@ -171,7 +188,7 @@ VALUES (
 );
 
 -- 샘플 API 2: Echo
-INSERT INTO APP_API_ROUTE_L (ROUTE_ID, API_PATH, HTTP_MTHD, API_NAME, API_DESC, TAGS, USE_YN, DEL_YN, CREA_BY)
+INSERT INTO APP_API_ROUTE_L (ROUTE_ID, API_PATH, HTTP_MTHD, API_NAME, API_DESC, TAGS, USE_YN, DEL_YN, CRNT_VERSION_NO, CREA_BY)
 VALUES (
     UUID(),
     'echo',
@@ -181,6 +198,7 @@ VALUES (
     'sample,echo',
     'Y',
     'N',
+    1,
     'system'
 );
 